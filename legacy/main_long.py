@@ -8,10 +8,18 @@ import math
 import re
 from datetime import datetime
 import sys
+import threading
 import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+import numpy as np
 import pandas as pd
 import flet as ft
 
+# Copy-on-Write (pandas >= 2.0): page slices and handler inputs can skip defensive copies
+with contextlib.suppress(Exception):
+    pd.set_option("mode.copy_on_write", True)
+
 # Flet 0.28.3+: prefer public modules; fall back when missing (older builds)
 try:
     icons = ft.icons  # most builds
@@ -42,7 +50,7 @@ except Exception:  # pragma: no cover
 # ---- Optional project modules (present in your repo) -----------------------
 try:
     from collector import build_workbook
-    from data_io import read_workbook, write_workbook, XL_PATH
+    from data_io import read_workbook, read_workbook_cached, write_workbook, XL_PATH
     from matching import Terms
     from auto_assign import run_auto_assign
     from push_assignments import push
@@ -51,6 +59,7 @@ try:
 except Exception:  # keep the app booting even if imports fail in dev
     build_workbook = None
     read_workbook = None
+    read_workbook_cached = None
     write_workbook = None
     XL_PATH = os.path.join("data", "sketchfab_data.xlsx")
     Terms = None
@@ -59,6 +68,25 @@ except Exception:  # keep the app booting even if imports fail in dev
     SketchfabClient = None
     find_similar_collections = None
 
+# ---- Optional JIT for term mining on very large liked sets ------------------
+try:
+    from numba import njit, types
+    from numba.typed import Dict
+except ImportError:  # plain pandas path only
+    njit = None
+
+# ---- Optional Arrow-backed strings for the free-text columns ---------------
+try:
+    import pyarrow  # noqa: F401  (backs pandas' "string[pyarrow]" dtype)
+    _ARROW_STR = pd.StringDtype("pyarrow")
+except ImportError:  # object-dtype strings as before
+    _ARROW_STR = None
+
+# single writer thread: saves run off the UI thread and land in submission order
+_save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+
+RESIZE_SETTLE_S = 0.15  # re-render once a window drag has been quiet this long
+
 # ----------------------------------------------------------------------------
 # Utility helpers
 # ----------------------------------------------------------------------------
@@ -75,35 +103,66 @@ def none_or(v: object) -> str:
     return s if s.strip() else "None"
 
 
+_TRUE_SET = frozenset({"1", "true", "yes", "y"})
+
+
 def safe_bool(v: object) -> bool:
     try:
         if v is None or (isinstance(v, float) and pd.isna(v)):
             return False
         if isinstance(v, (int, bool)):
             return bool(v)
-        return str(v).strip().lower() in {"1", "true", "yes", "y"}
+        return str(v).strip().lower() in _TRUE_SET
     except Exception:
         return False
 
 
+def safe_bool_series(s: pd.Series) -> np.ndarray:
+    """Column-wide safe_bool: one pandas pass instead of a try block per cell."""
+    if pd.api.types.is_bool_dtype(s) or pd.api.types.is_integer_dtype(s):
+        return s.fillna(0).astype(bool).to_numpy()
+    return s.astype(str).str.strip().str.lower().isin(_TRUE_SET).to_numpy()
+
+
+_EMPTY_STRS = ["", "none", "nan", "<na>"]
+
+
 def series_nonempty(s: pd.Series) -> pd.Series:
     if s is None:
         return pd.Series([], dtype=bool)
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # test each category once, then look rows up by code (-1 = missing)
+        cats = s.cat.categories
+        codes = s.cat.codes.to_numpy()
+        if len(cats) == 0:
+            return pd.Series(np.zeros(len(s), dtype=bool), index=s.index)
+        cat_ok = ~pd.Series(cats.astype(str)).str.strip().str.lower().isin(_EMPTY_STRS).to_numpy()
+        return pd.Series((codes >= 0) & cat_ok[codes], index=s.index)
     ss = s.astype(str).str.strip().str.lower()
-    empty_mask = ss.isin(["", "none", "nan", "<na>"])
+    empty_mask = ss.isin(_EMPTY_STRS)
     empty_mask |= s.isna()
     return ~empty_mask
 
 
+_SLUG_STRIP = re.compile(r"[^a-z0-9\-\s]")
+_SLUG_WS = re.compile(r"\s+")
+_SLUG_DASH = re.compile(r"-+")
+
+
 def slugify(name: str) -> str:
     """Create a collection slug like sketchfab expects (name-uid).
     Lowercase, spaces->hyphens, strip non-word chars, collapse dashes.
     """
     if not name:
         return "collection"
-    s = re.sub(r"[^a-z0-9\-\s]", "", str(name).lower())
-    s = re.sub(r"\s+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("-")
+    return _slugify_cached(str(name))
+
+
+@functools.lru_cache(maxsize=4096)
+def _slugify_cached(name: str) -> str:
+    s = _SLUG_STRIP.sub("", name.lower())
+    s = _SLUG_WS.sub("-", s)
+    s = _SLUG_DASH.sub("-", s).strip("-")
     return s or "collection"
 
 
@@ -112,8 +171,12 @@ def slugify(name: str) -> str:
 # ----------------------------------------------------------------------------
 class AppState:
     def __init__(self):
-        self.liked_df: pd.DataFrame | None = None
-        self.cols_df: pd.DataFrame | None = None
+        # bumped on every liked_df reassignment; keys the derived-data caches
+        self.liked_df_rev = 0
+        self._liked_df: pd.DataFrame | None = None
+        self._cols_df: pd.DataFrame | None = None
+        # sorted distinct collection names for the merge dropdowns (cleared with cols_df)
+        self._collection_names: tuple[str, ...] | None = None
         self.overwrite = False
         self.dry_run = True
         self.terms_topk = 100
@@ -133,6 +196,83 @@ class AppState:
         self.status: str = ""
         # viewport height for liked tab scroll area (computed at runtime)
         self.vh: int = 480
+        # table column spacing for the current page width (reset on resize)
+        self._col_spacing: int | None = None
+        # Terms tab: (key, full token counts) for key = (df, rev, min len, sample);
+        # one tuple so a background recount swaps key and value together
+        self._terms_cache: tuple | None = None
+        # identity of the latest Terms recount; older worker results are dropped
+        self._terms_pending_token: object | None = None
+        # liked_df-derived counts (cleared on every reassignment)
+        self._derived: dict[str, object] = {}
+        # last header row and the signature it was built from
+        self._header_sig: tuple | None = None
+        self._header_row: ft.Row | None = None
+        # per tab (liked, cols, report, log): rebuild before it is next shown
+        self.tab_dirty: list[bool] = [False] * 4
+        # pending resize re-render; each resize event restarts it
+        self._resize_timer: threading.Timer | None = None
+
+    @property
+    def liked_df(self) -> pd.DataFrame | None:
+        return self._liked_df
+
+    @liked_df.setter
+    def liked_df(self, df: pd.DataFrame | None) -> None:
+        self._liked_df = df
+        self.liked_df_rev += 1
+        self._derived.clear()
+
+    @property
+    def cols_df(self) -> pd.DataFrame | None:
+        return self._cols_df
+
+    @cols_df.setter
+    def cols_df(self, df: pd.DataFrame | None) -> None:
+        self._cols_df = df
+        self._collection_names = None
+
+    @property
+    def collection_names(self) -> tuple[str, ...]:
+        if self._collection_names is None:
+            df = self._cols_df
+            names: tuple[str, ...] = ()
+            if isinstance(df, pd.DataFrame) and not df.empty:
+                try:
+                    names = tuple(sorted(df.get("Collection Name", pd.Series(dtype=str)).dropna().astype(str).unique()))
+                except Exception:
+                    names = ()
+            self._collection_names = names
+        return self._collection_names
+
+    def liked_edited(self, **known) -> None:
+        """Record an in-place liked_df edit that keeps the memoized masks/counts valid.
+
+        Bumps the revision like a reassignment, but carries the derived entries
+        forward; `known` overrides the ones the caller has updated itself.
+        """
+        carried = dict(self._derived)
+        self.liked_df = self._liked_df
+        self._derived.update(carried, **known)
+
+    def _memo(self, key: str, compute):
+        if key not in self._derived:
+            self._derived[key] = compute()
+        return self._derived[key]
+
+    def nonempty(self, col: str) -> np.ndarray:
+        """series_nonempty over a liked_df column, computed once per revision."""
+        def compute() -> np.ndarray:
+            df = self.liked_df
+            if df is None or df.empty:
+                return np.zeros(0, dtype=bool)
+            return series_nonempty(df.get(col, pd.Series(index=df.index, dtype="object"))).to_numpy()
+        return self._memo(f"nonempty:{col}", compute)
+
+    def in_collection_mask(self) -> np.ndarray:
+        """Rows already in a collection or with an Assigned value (bool ndarray)."""
+        return self._memo("in_collection", lambda: np.logical_or(
+            self.nonempty("Already In Collection(s)"), self.nonempty("Assigned Collection(s)")))
 
     # derived counts (safe)
     @property
@@ -145,29 +285,33 @@ class AppState:
 
     @property
     def assigned_count(self) -> int:
+        return self._memo("assigned_count", self._count_assigned)
+
+    def _count_assigned(self) -> int:
         if self.liked_df is None or self.liked_df.empty:
             return 0
-        df = self.liked_df
-        a = df.get("Already In Collection(s)", pd.Series(index=df.index, dtype="object"))
-        c = df.get("Assigned Collection(s)", pd.Series(index=df.index, dtype="object"))
-        mask = series_nonempty(a) | series_nonempty(c)
-        return int(mask.sum())
+        return int(np.count_nonzero(self.in_collection_mask()))
 
     @property
     def pending_push_count(self) -> int:
         try:
-            df = ensure_annotation_columns(self.liked_df if isinstance(self.liked_df, pd.DataFrame) else pd.DataFrame())
-            if df is None or df.empty:
+            pending = self._memo("pending_rows", self._count_pending_rows)
+            if pending is None:
                 return len(self.manual_edits or {})
-            # Prefer new canonical name
-            colname = "Assigned Collection(s)" if "Assigned Collection(s)" in df.columns else "Assigned Collection"
-            mask_assigned = series_nonempty(df.get(colname, pd.Series(index=df.index, dtype="object")))
-            pushed = df.get("Push Sent", pd.Series(index=df.index, dtype="object")).fillna(False)
-            pending = mask_assigned & (~pushed.astype(bool))
-            return int(pending.sum()) + (1 if (self.manual_edits or {}) else 0)
+            return pending + (1 if (self.manual_edits or {}) else 0)
         except Exception:
             return 0
 
+    def _count_pending_rows(self) -> int | None:
+        df = ensure_annotation_columns(self.liked_df if isinstance(self.liked_df, pd.DataFrame) else pd.DataFrame())
+        if df is None or df.empty:
+            return None
+        # Prefer new canonical name
+        colname = "Assigned Collection(s)" if "Assigned Collection(s)" in df.columns else "Assigned Collection"
+        mask_assigned = self.nonempty(colname)
+        pushed = safe_bool_series(df.get("Push Sent", pd.Series(index=df.index, dtype="object")))
+        return int(np.count_nonzero(mask_assigned & ~pushed))
+
     @property
     def liked_pages(self) -> int:
         if self.liked_count == 0:
@@ -179,13 +323,19 @@ class AppState:
             return pd.DataFrame()
         start = max(0, self.liked_page) * max(1, self.liked_page_size)
         end = start + max(1, self.liked_page_size)
-        return self.liked_df.iloc[start:end].copy()
+        return self.liked_df.iloc[start:end]  # read-only slice for the table builder
 
 
 # ----------------------------------------------------------------------------
 # Persistence helpers
 # ----------------------------------------------------------------------------
 PERSIST_COLS = ["Manual", "Push Sent", "Pushed At"]
+# low-cardinality, display/scan-only columns; Assigned and Manual stay object
+# since they are edited in place with arbitrary new values
+CATEGORY_COLS = [
+    "Author", "License", "Already In Collection(s)", "Auto-Assigned Collection(s)",
+    "Suggested Collection(s)", "Fuzzy Match Collection(s)",
+]
 
 
 def ensure_annotation_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -207,6 +357,26 @@ def ensure_annotation_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+# free text the term miner and matcher run .str kernels over
+TEXT_COLS = ["Name", "Model Name", "Description", "Tags"]
+
+
+def arrow_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    if _ARROW_STR is None:
+        return df
+    for col in TEXT_COLS:
+        if col in df.columns and df[col].dtype != _ARROW_STR:
+            df[col] = df[col].astype(_ARROW_STR)
+    return df
+
+
+def categorize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    for col in CATEGORY_COLS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
 def merge_preserve(prev: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
     """Preserve manual annotations and push flags across a recollect.
     Match by UID.
@@ -218,28 +388,44 @@ def merge_preserve(prev: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
     if prev is None or prev.empty:
         return fresh
     prev = ensure_annotation_columns(prev)
-    # map UID -> values
-    m = prev.set_index("UID")[PERSIST_COLS].to_dict(orient="index")
-    vals = fresh["UID"].map(lambda u: m.get(u, {}))
+    # hash-join prev onto fresh by UID (keeps fresh's row order and index)
+    carried = prev[["UID"] + PERSIST_COLS].drop_duplicates("UID").set_index("UID").reindex(fresh["UID"])
     # write back column-wise
     for col in PERSIST_COLS:
-        fresh[col] = [(d.get(col) if isinstance(d, dict) else None) for d in vals]
+        fresh[col] = carried[col].to_numpy()
         # normalize defaults
         if col == "Manual":
             fresh[col] = fresh[col].fillna("")
         elif col == "Push Sent":
-            try:
-                s = fresh[col].fillna(False)
-                # future-safe: infer dtype then cast to bool
-                s = s.infer_objects(copy=False)
-                fresh[col] = s.astype(bool)
-            except Exception:
-                fresh[col] = fresh[col].fillna(False)
+            # "FALSE"/"No" strings from a hand-edited sheet must not cast to True
+            fresh[col] = safe_bool_series(fresh[col])
         elif col == "Pushed At":
             fresh[col] = fresh[col].fillna("")
     return fresh
 
 
+def apply_manual_edits(df: pd.DataFrame, edits: dict[str, str]) -> int:
+    """Write buffered Manual edits into df in place, UID-joined in one pass.
+    Non-blank values also fill the effective Assigned slot. Returns the number of
+    edits that matched a row.
+    """
+    if not edits or df is None or df.empty or "UID" not in df.columns:
+        return 0
+    uids = df["UID"].astype(str)
+    buf = pd.Series(list(edits.values()), index=[str(u) for u in edits], dtype="object")
+    buf = buf[~buf.index.duplicated(keep="last")]
+    vals = uids.map(buf)
+    hit = vals.notna()
+    if not hit.any():
+        return 0
+    df.loc[hit, "Manual"] = vals[hit].to_numpy()
+    stripped = vals.fillna("").astype(str).str.strip()
+    # keep manual separate, but also set the effective assigned slot
+    assign = hit & (stripped != "")
+    df.loc[assign, "Assigned Collection(s)"] = stripped[assign].to_numpy()
+    return int(buf.index.isin(uids).sum())
+
+
 # ----------------------------------------------------------------------------
 # UI builders
 # ----------------------------------------------------------------------------
@@ -248,9 +434,15 @@ _header_style = ft.TextStyle(size=13, weight=ft.FontWeight.BOLD)
 
 
 def top_stat_line(page: ft.Page, state: AppState) -> ft.Row:
-    xl = XL_PATH if os.path.exists(XL_PATH) else f"(missing) {XL_PATH}"
+    xl_ok = os.path.exists(XL_PATH)
+    xl = XL_PATH if xl_ok else f"(missing) {XL_PATH}"
     token = os.environ.get("SKETCHFAB_TOKEN")
     pending = state.pending_push_count
+    # reuse the last row when nothing it shows has changed
+    sig = (xl_ok, bool(token), state.liked_count, state.assigned_count, state.collections_count,
+           pending, state.dirty, state.username)
+    if state._header_row is not None and sig == state._header_sig:
+        return state._header_row
     ok = (pending == 0) and (not state.dirty)
     ico = icons.CHECK if ok else icons.CLOSE
     col = colors.GREEN_400 if ok else colors.RED_400
@@ -271,7 +463,9 @@ def top_stat_line(page: ft.Page, state: AppState) -> ft.Row:
     ]
     if state.username:
         parts.extend([ft.Text("—"), ft.Text(f"User: {state.username}", size=12, color=colors.GREY_300)])
-    return ft.Row(controls=parts, alignment=ft.MainAxisAlignment.START, spacing=12)
+    row = ft.Row(controls=parts, alignment=ft.MainAxisAlignment.START, spacing=12)
+    state._header_sig, state._header_row = sig, row
+    return row
 
 
 def toolbar_row(page: ft.Page, state: AppState,
@@ -301,14 +495,14 @@ def toolbar_row(page: ft.Page, state: AppState,
 
 # --- Data table builders -----------------------------------------------------
 
-def _hdr(label: str) -> ft.DataColumn:
-    # Short labels with manual wrapping using "" to avoid overlap
-    return ft.DataColumn(ft.Text(label, style=_header_style, no_wrap=False, max_lines=2, text_align=ft.TextAlign.CENTER))
+def _hdr_text(label: str) -> ft.Text:
+    # Short labels with manual wrapping using "\n" to avoid overlap
+    return ft.Text(label, style=_header_style, no_wrap=False, max_lines=2, text_align=ft.TextAlign.CENTER)
 
 
-def name_link_cell(name: str, uid: str) -> ft.DataCell:
+def name_link(name: str, uid: str) -> ft.TextButton:
     url = f"https://sketchfab.com/models/{uid}"
-    return ft.DataCell(ft.TextButton(text=none_or(name), url=url))
+    return ft.TextButton(text=none_or(name), url=url)
 
 
 def collection_link_cell(col_name: str, col_uid: str, username: str | None) -> ft.DataCell:
@@ -322,94 +516,146 @@ def collection_link_cell(col_name: str, col_uid: str, username: str | None) -> f
     return ft.DataCell(ft.TextButton(text=none_or(col_name), url=url))
 
 
-def bool_badge_cell(v: object) -> ft.DataCell:
-    ok = safe_bool(v)
+def badge(ok: bool) -> ft.Icon:
     icon = icons.CHECK if ok else icons.CLOSE
     col = colors.GREEN_400 if ok else colors.RED_400
-    return ft.DataCell(ft.Icon(name=icon, color=col, size=18))
+    return ft.Icon(name=icon, color=col, size=18)
 
 
-def text_cell(v: object) -> ft.DataCell:
+def text_value(v: object) -> ft.Text:
     s = none_or(v)
     c = colors.GREY_500 if s == "None" else None
-    return ft.DataCell(ft.Text(s, color=c))
+    return ft.Text(s, color=c)
 
 
-def _column_spacing_for(page: ft.Page) -> int:
-    try:
-        w = page.width or 1400
-    except Exception:
-        w = 1400
-    if w < 1100:
-        return 18
-    if w < 1400:
-        return 24
-    return 28
+def text_cell(v: object) -> ft.DataCell:
+    return ft.DataCell(text_value(v))
 
 
-def build_liked_table(page: ft.Page, state: AppState, df: pd.DataFrame, row_offset: int = 0) -> ft.DataTable:
-    cols = [
-        _hdr("#"),
-        _hdr("Name"),
-        _hdr("UID"),
-        _hdr("Assigned"),
-        _hdr("Manual"),
-        _hdr("Already\nIn"),
-        _hdr("Auto\nAssigned"),
-        _hdr("Suggested"),
-        _hdr("Fuzzy\nMatch"),
-        _hdr("Author"),
-        _hdr("License"),
-        _hdr("DL"),
-        _hdr("Tags"),
+def _column_spacing_for(page: ft.Page, state: AppState) -> int:
+    # page.width only changes on resize, which clears state._col_spacing
+    if state._col_spacing is None:
+        try:
+            w = page.width or 1400
+        except Exception:
+            w = 1400
+        state._col_spacing = 18 if w < 1100 else 24 if w < 1400 else 28
+    return state._col_spacing
+
+
+# --- Liked models list (virtualized) -----------------------------------------
+
+LIKED_ROW_EXTENT = 46  # fixed row height, so a scroll offset maps straight to a row index
+LIKED_ROW_BUFFER = 10  # rows built beyond the viewport on each side
+LIKED_COLUMNS = [  # (header, width)
+    ("#", 50), ("Name", 240), ("UID", 130), ("Assigned", 180), ("Manual", 360),
+    ("Already\nIn", 160), ("Auto\nAssigned", 160), ("Suggested", 180), ("Fuzzy\nMatch", 180),
+    ("Author", 140), ("License", 160), ("DL", 40), ("Tags", 280),
+]
+
+
+def _liked_page_columns(df: pd.DataFrame) -> list[list]:
+    # pull each column out once; no per-row Series from df.iloc
+    blank = pd.Series(index=df.index, dtype="object")
+
+    def col(name: str) -> list:
+        s = df.get(name, blank)
+        if _ARROW_STR is not None and s.dtype == _ARROW_STR:
+            return s.to_numpy(dtype=object, na_value=None).tolist()  # pd.NA isn't usable in `a or b`
+        return s.tolist()
+
+    n = len(df)
+    return [
+        col("Name"), col("Model Name"),
+        df["UID"].astype(str).tolist() if "UID" in df.columns else [""] * n,
+        df["Manual"].astype(str).tolist() if "Manual" in df.columns else [""] * n,
+        col("Assigned Collection(s)"), col("Already In Collection(s)"), col("Auto-Assigned Collection(s)"),
+        col("Suggested Collection(s)"), col("Fuzzy Match Collection(s)"),
+        col("Author"), col("License"), safe_bool_series(df.get("Downloadable", blank)).tolist(), col("Tags"),
     ]
 
-    rows: list[ft.DataRow] = []
-    if df is not None and not df.empty:
-        for i in range(len(df)):
-            r = df.iloc[i]
-            uid = str(r.get("UID", ""))
-            # manual value resolves to buffer -> column -> ''
-            manual_val = state.manual_edits.get(uid, str(r.get("Manual", "")))
-            tf = ft.TextField(value=manual_val, dense=True, width=360)
-
-            def _mk_on_change(the_uid: str, field: ft.TextField):
-                def _handler(e):
-                    state.manual_edits[the_uid] = field.value or ""
-                    state.dirty = True
-                return _handler
-            tf.on_change = _mk_on_change(uid, tf)
 
-            rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(row_offset + i + 1))),
-                        name_link_cell(r.get("Name") or r.get("Model Name"), uid),
-                        text_cell(uid),
-                        text_cell(r.get("Assigned Collection(s)")),
-                        ft.DataCell(tf),
-                        text_cell(r.get("Already In Collection(s)")),
-                        text_cell(r.get("Auto-Assigned Collection(s)")),
-                        text_cell(r.get("Suggested Collection(s)")),
-                        text_cell(r.get("Fuzzy Match Collection(s)")),
-                        text_cell(r.get("Author")),
-                        text_cell(r.get("License")),
-                        bool_badge_cell(r.get("Downloadable")),
-                        text_cell(r.get("Tags")),
-                    ]
-                )
-            )
+def _liked_row(state: AppState, columns: list[list], i: int, row_offset: int, spacing: int,
+               on_manual_change) -> ft.Row:
+    name, model_name, uid, manual, assigned, already, auto, sug, fuzzy, author, lic, dl_ok, tags = (c[i] for c in columns)
+    # manual value resolves to buffer -> column -> ''
+    manual_val = state.manual_edits.get(uid, manual)
+    # the row's uid rides on .data so every field shares one handler
+    tf = ft.TextField(value=manual_val, dense=True, width=360, data=uid, on_change=on_manual_change)
+
+    cells = [
+        ft.Text(str(row_offset + i + 1)),
+        name_link(name or model_name, uid),
+        text_value(uid),
+        text_value(assigned),
+        tf,
+        text_value(already),
+        text_value(auto),
+        text_value(sug),
+        text_value(fuzzy),
+        text_value(author),
+        text_value(lic),
+        badge(dl_ok),
+        text_value(tags),
+    ]
+    return ft.Row(
+        controls=[ft.Container(content=c, width=w) for c, (_, w) in zip(cells, LIKED_COLUMNS)],
+        spacing=spacing,
+        height=LIKED_ROW_EXTENT,
+    )
+
+
+def build_liked_list(page: ft.Page, state: AppState, df: pd.DataFrame, row_offset: int = 0) -> ft.Container:
+    """Header + ListView for one liked page. Rows start as empty placeholders of
+    fixed height and are only built once they scroll near the viewport.
+    """
+    spacing = _column_spacing_for(page, state)
+    width = sum(w for _, w in LIKED_COLUMNS) + spacing * (len(LIKED_COLUMNS) - 1)
+    header = ft.Row(
+        controls=[ft.Container(content=_hdr_text(label), width=w) for label, w in LIKED_COLUMNS],
+        spacing=spacing,
+        height=54,
+    )
+
+    columns = _liked_page_columns(df) if df is not None and not df.empty else []
+    n = len(columns[0]) if columns else 0
+    built = [False] * n
 
-    return ft.DataTable(
-        columns=cols,
-        rows=rows,
-        column_spacing=_column_spacing_for(page),
-        heading_row_height=54,
-        data_row_max_height=46,
+    def on_manual_change(e: ft.ControlEvent):
+        state.manual_edits[e.control.data] = e.control.value or ""
+        state.dirty = True
+
+    lv = ft.ListView(
+        expand=True,
+        spacing=0,
+        item_extent=LIKED_ROW_EXTENT,
+        controls=[ft.Container(height=LIKED_ROW_EXTENT) for _ in range(n)],
     )
 
+    def fill(first: int, last: int) -> bool:
+        changed = False
+        for i in range(max(0, first), min(n, last)):
+            if not built[i]:
+                lv.controls[i] = _liked_row(state, columns, i, row_offset, spacing, on_manual_change)
+                built[i] = True
+                changed = True
+        return changed
 
-def build_collections_table(page: ft.Page, df: pd.DataFrame, username: str | None) -> ft.DataTable:
+    visible = max(1, state.vh // LIKED_ROW_EXTENT)
+    fill(0, visible + LIKED_ROW_BUFFER)
+
+    def on_scroll(e: ft.OnScrollEvent):
+        first = int(e.pixels // LIKED_ROW_EXTENT)
+        if fill(first - LIKED_ROW_BUFFER, first + visible + LIKED_ROW_BUFFER):
+            lv.update()
+
+    lv.on_scroll = on_scroll
+    lv.on_scroll_interval = 50
+
+    return ft.Container(width=width, content=ft.Column([header, lv], spacing=0, expand=True))
+
+
+def build_collections_table(page: ft.Page, state: AppState, df: pd.DataFrame) -> ft.DataTable:
     cols = [
         ft.DataColumn(ft.Text("#", style=_header_style, no_wrap=True)),
         ft.DataColumn(ft.Text("Collection Name", style=_header_style, no_wrap=False, max_lines=2)),
@@ -424,34 +670,106 @@ def build_collections_table(page: ft.Page, df: pd.DataFrame, username: str | Non
                 ft.DataRow(
                     cells=[
                         ft.DataCell(ft.Text(str(i + 1))),
-                        collection_link_cell(r.get("Collection Name"), r.get("Collection UID"), username),
+                        collection_link_cell(r.get("Collection Name"), r.get("Collection UID"), state.username),
                         text_cell(r.get("Collection UID")),
                         text_cell(r.get("Model Count")),
                     ]
                 )
             )
-    return ft.DataTable(columns=cols, rows=rows, column_spacing=_column_spacing_for(page), heading_row_height=40, data_row_max_height=44)
+    return ft.DataTable(columns=cols, rows=rows, column_spacing=_column_spacing_for(page, state), heading_row_height=40, data_row_max_height=44)
 
 
 # --- Terms / report ----------------------------------------------------------
 
-def mine_terms(df: pd.DataFrame, top_k: int, min_len: int, sample_n: int | None) -> pd.DataFrame:
-    from collections import Counter
+_TOKEN_PATTERNS: dict[int, re.Pattern] = {}  # min_len -> [a-z0-9]{min_len,}
+
+
+def _token_pattern(min_len: int) -> re.Pattern:
+    pat = _TOKEN_PATTERNS.get(min_len)
+    if pat is None:
+        pat = _TOKEN_PATTERNS[min_len] = re.compile(rf"[a-z0-9]{{{min_len},}}")
+    return pat
 
-    out = Counter()
+
+def term_counts(df: pd.DataFrame, min_len: int, sample_n: int | None) -> pd.DataFrame:
+    """All tokens of at least min_len chars with their counts, most common first."""
     if df is None or df.empty:
         return pd.DataFrame(columns=["term", "count"])
     if sample_n and int(sample_n) > 0:
         df = df.head(int(sample_n))  # else use ALL
 
-    for _, r in df.iterrows():
-        name = (r.get("Name") or r.get("Model Name") or "")
-        tags = str(r.get("Tags") or "")
-        for t in re.findall(r"[a-z0-9]+", (str(name) + " " + tags).lower()):
-            if len(t) >= int(min_len):
-                out[t] += 1
-    pairs = sorted(out.items(), key=lambda x: x[1], reverse=True)[: int(top_k)]
-    return pd.DataFrame(pairs, columns=["term", "count"]) if pairs else pd.DataFrame(columns=["term", "count"]) 
+    # one vectorized pass: Name (or Model Name) + Tags -> lowercase -> tokens
+    blank = pd.Series(index=df.index, dtype="object")
+    to_str = _ARROW_STR or str  # keep Arrow columns on the Arrow kernels
+    name = df.get("Name", blank).fillna(df.get("Model Name", blank)).fillna("").astype(to_str)
+    tags = df.get("Tags", blank).fillna("").astype(to_str)
+    text = (name + " " + tags).str.lower()
+    if njit is not None and len(text) >= JIT_MIN_ROWS:
+        return _term_counts_jit(text, int(min_len))
+    tokens = text.str.findall(_token_pattern(int(min_len))).explode().dropna()
+    if tokens.empty:
+        return pd.DataFrame(columns=["term", "count"])
+    return tokens.value_counts().rename_axis("term").reset_index(name="count")
+
+
+JIT_MIN_ROWS = 20000  # below this the regex pass wins over JIT dispatch
+
+_TOKEN_LUT = np.zeros(256, dtype=np.bool_)
+_TOKEN_LUT[np.frombuffer(b"abcdefghijklmnopqrstuvwxyz0123456789", dtype=np.uint8)] = True
+
+if njit is not None:
+    @njit(cache=True)  # cache=True keeps the compile off later app starts
+    def _count_tokens_kernel(buf, is_tok, min_len):
+        # FNV-1a hash per [a-z0-9]+ run; remember where each hash was first seen
+        counts = Dict.empty(key_type=types.uint64, value_type=types.int64)
+        first = Dict.empty(key_type=types.uint64, value_type=types.int64)
+        n = buf.shape[0]
+        i = 0
+        while i < n:
+            if not is_tok[buf[i]]:
+                i += 1
+                continue
+            start = i
+            h = np.uint64(14695981039346656037)
+            while i < n and is_tok[buf[i]]:
+                h = (h ^ np.uint64(buf[i])) * np.uint64(1099511628211)
+                i += 1
+            if i - start >= min_len:
+                if h in counts:
+                    counts[h] += 1
+                else:
+                    counts[h] = 1
+                    first[h] = start
+        m = len(counts)
+        starts = np.empty(m, dtype=np.int64)
+        ends = np.empty(m, dtype=np.int64)
+        cnts = np.empty(m, dtype=np.int64)
+        k = 0
+        for h, c in counts.items():
+            st = first[h]
+            end = st
+            while end < n and is_tok[buf[end]]:
+                end += 1
+            starts[k] = st
+            ends[k] = end
+            cnts[k] = c
+            k += 1
+        return starts, ends, cnts
+
+
+def _term_counts_jit(text: pd.Series, min_len: int) -> pd.DataFrame:
+    # rows joined by a non-token byte so tokens never span rows
+    raw = "\n".join(text.tolist()).encode("ascii", "replace")
+    starts, ends, cnts = _count_tokens_kernel(np.frombuffer(raw, dtype=np.uint8), _TOKEN_LUT, min_len)
+    if len(cnts) == 0:
+        return pd.DataFrame(columns=["term", "count"])
+    terms = [raw[st:end].decode("ascii") for st, end in zip(starts.tolist(), ends.tolist())]
+    counts = pd.Series(cnts, index=pd.Index(terms, name="term")).sort_values(ascending=False, kind="stable")
+    return counts.reset_index(name="count")
+
+
+def mine_terms(df: pd.DataFrame, top_k: int, min_len: int, sample_n: int | None) -> pd.DataFrame:
+    return term_counts(df, min_len, sample_n).head(int(top_k))
 
 
 def build_terms_view(page: ft.Page, state: AppState) -> ft.Row:
@@ -466,13 +784,18 @@ def build_terms_view(page: ft.Page, state: AppState) -> ft.Row:
 
     def compute_pending():
         if state.liked_df is not None and not state.liked_df.empty:
-            df = state.liked_df
-            a = df.get("Already In Collection(s)", pd.Series(index=df.index, dtype="object"))
-            c = df.get("Assigned Collection(s)", pd.Series(index=df.index, dtype="object"))
-            mask = ~(series_nonempty(a) | series_nonempty(c))
-            return df.loc[mask]
+            return state.liked_df.loc[~state.in_collection_mask()]
         return pd.DataFrame()
 
+    def cached_terms() -> pd.DataFrame:
+        # Top K only slices the counts; recount when data, min len or sample change
+        key = (id(state.liked_df), state.liked_df_rev, state.terms_minlen, state.terms_sample)
+        cached = state._terms_cache
+        if cached is None or cached[0] != key:
+            cached = (key, term_counts(compute_pending(), state.terms_minlen, (state.terms_sample or None)))
+            state._terms_cache = cached
+        return cached[1].head(int(state.terms_topk))
+
     pending0 = compute_pending()
     max_sample = max(500, len(pending0))
     s_samp = ft.Slider(min=0, max=float(max_sample), divisions=50, value=float(state.terms_sample))
@@ -495,7 +818,7 @@ def build_terms_view(page: ft.Page, state: AppState) -> ft.Row:
             ]))
         return rows
 
-    terms_df = mine_terms(pending0, state.terms_topk, state.terms_minlen, (state.terms_sample or None))
+    terms_df = cached_terms()
     terms_table = ft.DataTable(
         columns=[
             ft.DataColumn(ft.Text("#", style=_header_style, no_wrap=True)),
@@ -503,15 +826,23 @@ def build_terms_view(page: ft.Page, state: AppState) -> ft.Row:
             ft.DataColumn(ft.Text("count", style=_header_style, no_wrap=True)),
         ],
         rows=make_rows(terms_df),
-        column_spacing=_column_spacing_for(page),
+        column_spacing=_column_spacing_for(page, state),
         heading_row_height=40,
     )
 
     def update_terms(_=None):
         sync_labels_from_sliders()
-        df_new = mine_terms(compute_pending(), state.terms_topk, state.terms_minlen, (state.terms_sample or None))
-        terms_table.rows = make_rows(df_new)
-        page.update()
+        token = state._terms_pending_token = object()
+        page.update()  # labels now; the table follows when the recount lands
+
+        def worker():
+            df_new = cached_terms()
+            if token is not state._terms_pending_token:
+                return  # a later slider release superseded this run
+            terms_table.rows = make_rows(df_new)
+            page.update()
+
+        page.run_thread(worker)
 
     for sl in (s_topk, s_minl, s_samp):
         sl.on_change_end = update_terms
@@ -593,8 +924,9 @@ def main(page: ft.Page):
     # Load data if workbook exists
     if read_workbook and os.path.exists(XL_PATH):
         try:
-            liked, cols = read_workbook()
+            liked, cols = read_workbook_cached()
             liked = ensure_annotation_columns(liked if isinstance(liked, pd.DataFrame) else pd.DataFrame())
+            liked = categorize_columns(arrow_text_columns(liked))
             state.liked_df = liked
             state.cols_df = cols
         except Exception as ex:
@@ -630,21 +962,33 @@ def main(page: ft.Page):
         except Exception:
             pass
 
-    def save_workbook_silent(msg: str | None = None):
+    def save_workbook_silent(msg: str | None = None, wait: bool = False):
         if write_workbook and isinstance(state.liked_df, pd.DataFrame):
-            try:
-                ensure_annotation_columns(state.liked_df)
-                write_workbook(state.liked_df, (state.cols_df if isinstance(state.cols_df, pd.DataFrame) else pd.DataFrame()))
-                state.dirty = False
-                if msg:
-                    page.snack_bar = ft.SnackBar(ft.Text(msg))
+            ensure_annotation_columns(state.liked_df)
+            # snapshot, so edits made while the writer runs can't tear the save
+            liked = state.liked_df.copy()
+            cols = state.cols_df.copy() if isinstance(state.cols_df, pd.DataFrame) else pd.DataFrame()
+            state.dirty = False  # edits during the save set it again
+
+            def on_saved(fut):
+                ex = fut.exception()
+                if ex is None:
+                    if msg:
+                        page.snack_bar = ft.SnackBar(ft.Text(msg))
+                        page.snack_bar.open = True
+                    add_log(msg or "Saved workbook")
+                else:
+                    state.dirty = True
+                    page.snack_bar = ft.SnackBar(ft.Text(f"Save error: {ex}"))
                     page.snack_bar.open = True
-                add_log(msg or "Saved workbook")
-            except Exception as ex:
-                page.snack_bar = ft.SnackBar(ft.Text(f"Save error: {ex}"))
-                page.snack_bar.open = True
-                add_log(f"Save error: {ex}")
-        page.update()
+                    add_log(f"Save error: {ex}")
+                page.update()
+
+            fut = _save_pool.submit(write_workbook, liked, cols)
+            # the callback fires on the save thread; the UI work runs on a page handler thread
+            fut.add_done_callback(lambda f: page.run_thread(on_saved, f))
+            if wait:
+                wait_futures([fut])
 
     # --- handlers for toolbar buttons ---------------------------------------
     def do_collect(e):
@@ -658,14 +1002,17 @@ def main(page: ft.Page):
             # Stream collector prints into top-right status
             class _StatusWriter:
                 def __init__(self, setter):
-                    self._buf = ""
+                    self._parts: list[str] = []  # pieces of the current, unfinished line
                     self._setter = setter
                 def write(self, s: str):
                     if not isinstance(s, str):
                         s = str(s)
-                    self._buf += s
-                    while "\n" in self._buf:
-                        line, self._buf = self._buf.split("\n", 1)
+                    if "\n" not in s:
+                        self._parts.append(s)
+                        return
+                    *lines, tail = ("".join(self._parts) + s).split("\n")
+                    self._parts = [tail] if tail else []
+                    for line in lines:
                         line = line.strip()
                         if line:
                             self._setter(line)
@@ -680,9 +1027,10 @@ def main(page: ft.Page):
 
             sw = _StatusWriter(_set_status)
             with contextlib.redirect_stdout(sw):
-                path = build_workbook()
+                # the collector rewrites XL_PATH too: queue it behind any save still running
+                path = _save_pool.submit(build_workbook).result()
             liked, cols = read_workbook()
-            liked = merge_preserve(prev, liked)
+            liked = categorize_columns(arrow_text_columns(merge_preserve(prev, liked)))
             state.liked_df, state.cols_df = liked, cols
             header.controls = top_stat_line(page, state).controls
             render_all_tabs()
@@ -710,15 +1058,14 @@ def main(page: ft.Page):
             return
         try:
             terms = Terms.from_yaml(os.environ.get("TERMS_PATH", os.path.join("terms", "collections_terms.yaml")))
-            updated = run_auto_assign(state.liked_df.copy(), terms, overwrite=False)
+            updated = run_auto_assign(state.liked_df, terms, overwrite=False)
             # keep manual edits & push flags
-            updated = merge_preserve(state.liked_df, updated)
-            if write_workbook:
-                write_workbook(updated, (state.cols_df if isinstance(state.cols_df, pd.DataFrame) else pd.DataFrame()))
+            # same dtypes as a loaded or collected workbook
+            updated = categorize_columns(arrow_text_columns(merge_preserve(state.liked_df, updated)))
             state.liked_df = updated
+            save_workbook_silent()  # through the single save thread, never beside a running save
             header.controls = top_stat_line(page, state).controls
             render_all_tabs()
-            page.update()
             try:
                 add_log("Computed suggestions/fuzzy (Match)")
             except Exception:
@@ -726,7 +1073,7 @@ def main(page: ft.Page):
         except Exception as ex:
             page.snack_bar = ft.SnackBar(ft.Text(f"Match error: {ex}"))
             page.snack_bar.open = True
-            page.update()
+        page.update()
 
     def do_auto(e):
         if state.liked_df is None or state.liked_df.empty or run_auto_assign is None or Terms is None:
@@ -736,14 +1083,13 @@ def main(page: ft.Page):
             return
         try:
             terms = Terms.from_yaml(os.environ.get("TERMS_PATH", os.path.join("terms", "collections_terms.yaml")))
-            updated = run_auto_assign(state.liked_df.copy(), terms, overwrite=state.overwrite)
-            updated = merge_preserve(state.liked_df, updated)
-            if write_workbook:
-                write_workbook(updated, (state.cols_df if isinstance(state.cols_df, pd.DataFrame) else pd.DataFrame()))
+            updated = run_auto_assign(state.liked_df, terms, overwrite=state.overwrite)
+            # same dtypes as a loaded or collected workbook
+            updated = categorize_columns(arrow_text_columns(merge_preserve(state.liked_df, updated)))
             state.liked_df = updated
+            save_workbook_silent()  # through the single save thread, never beside a running save
             header.controls = top_stat_line(page, state).controls
             render_all_tabs()
-            page.update()
             try:
                 add_log(f"Auto-assign complete (overwrite={state.overwrite})")
             except Exception:
@@ -751,7 +1097,7 @@ def main(page: ft.Page):
         except Exception as ex:
             page.snack_bar = ft.SnackBar(ft.Text(f"Auto-assign error: {ex}"))
             page.snack_bar.open = True
-            page.update()
+        page.update()
 
     def do_push(e):
         if push is None or SketchfabClient is None:
@@ -764,8 +1110,8 @@ def main(page: ft.Page):
             # rows that actually have an Assigned Collection to push
             df = state.liked_df if isinstance(state.liked_df, pd.DataFrame) else pd.DataFrame()
             df = ensure_annotation_columns(df)
-            mask = series_nonempty(df.get("Assigned Collection(s)", pd.Series(index=df.index, dtype="object")))
-            rows_to_push = df.loc[mask].copy()
+            mask = state.nonempty("Assigned Collection(s)")
+            rows_to_push = df.loc[mask]  # push() only reads; CoW covers the rename below
 
             # Adapter: map UI/collector schema -> pipeline push schema
             # push() expects columns: "Model UID", "Assigned Collection(s)"
@@ -786,9 +1132,15 @@ def main(page: ft.Page):
             )
             if not state.dry_run:
                 ts = datetime.now().strftime("%Y-%m-%d %H:%M")
-                df.loc[mask, "Push Sent"] = True
-                df.loc[mask, "Pushed At"] = ts
-                state.liked_df = df
+                # positional writes with the ndarray mask: no label lookup or alignment
+                rows = np.flatnonzero(mask)
+                df.iloc[rows, df.columns.get_loc("Push Sent")] = True
+                df.iloc[rows, df.columns.get_loc("Pushed At")] = ts
+                if df is state.liked_df:
+                    # Assigned is untouched and every assigned row is now sent
+                    state.liked_edited(pending_rows=0)
+                else:
+                    state.liked_df = df
                 state.dirty = True
                 save_workbook_silent("Pushed & saved")
             else:
@@ -817,16 +1169,9 @@ def main(page: ft.Page):
             return
         df = ensure_annotation_columns(df)
         # write manual buffer to column and Assigned Collection(s)
-        changed = 0
-        for uid, val in list(state.manual_edits.items()):
-            idx = df.index[df["UID"].astype(str) == str(uid)]
-            if len(idx) > 0:
-                df.loc[idx, "Manual"] = val
-                # keep manual separate, but also set the effective assigned slot
-                if val.strip():
-                    df.loc[idx, "Assigned Collection(s)"] = val.strip()
-                changed += 1
+        changed = apply_manual_edits(df, state.manual_edits)
         if changed:
+            state.manual_edits.clear()  # now held by the Manual column
             state.liked_df = df
             state.dirty = True
             header.controls = top_stat_line(page, state).controls
@@ -839,6 +1184,7 @@ def main(page: ft.Page):
 
     def do_save(e):
         save_workbook_silent("Saved")
+        page.update()
 
     toolbar = toolbar_row(page, state, do_collect, do_match, do_auto, do_push, do_apply_manual, do_save)
 
@@ -871,29 +1217,42 @@ def main(page: ft.Page):
     page.window_prevent_close = False
     def on_window_event(e: ft.WindowEvent):
         if e.data == "close" and state.dirty:
-            save_workbook_silent("Auto-saved on close")
+            save_workbook_silent("Auto-saved on close", wait=True)
             try:
                 add_log("Auto-saved on window close")
             except Exception:
                 pass
     page.on_window_event = on_window_event
 
-    # Update viewport height on resize to keep liked tab scroll working
-    def on_resize(e: ft.ControlEvent):
+    # Update viewport height on resize to keep liked tab scroll working.
+    # Debounced; only the visible tab is rebuilt now, the rest when they are selected.
+    def settle_resize():
         try:
             state.vh = compute_vh()
-            # Rerender all tabs so each viewport height updates
-            render_liked_tab()
-            render_cols_tab()
-            render_report_tab()
+            state._col_spacing = None
+            state.tab_dirty = [True, True, True, False]  # the log doesn't depend on size
+            render_visible_tab()
             page.update()
         except Exception:
             pass
+
+    def on_resize(e: ft.ControlEvent):
+        if state._resize_timer is not None:
+            state._resize_timer.cancel()  # still dragging; restart the quiet period
+        # the timer thread only hands the render to the page's own handler thread
+        state._resize_timer = threading.Timer(RESIZE_SETTLE_S, page.run_thread, args=(settle_resize,))
+        state._resize_timer.daemon = True
+        state._resize_timer.start()
     try:
         page.on_resize = on_resize
     except Exception:
         pass
 
+    def on_tab_change(e):
+        if render_visible_tab():
+            page.update()
+    tabs.on_change = on_tab_change
+
     # Helper to create a centered container with horizontal scroll for wide tables
     def centered_table_container(child: ft.Control) -> ft.Column:
         # Center the table; keep horizontal scrollbar visible when needed
@@ -907,7 +1266,6 @@ def main(page: ft.Page):
         df_all = ensure_annotation_columns(df_all)
         if df_all is None or df_all.empty:
             liked_tab.content = ft.Column([ft.Text("No liked models loaded")])
-            page.update()
             return
 
         # clamp current page
@@ -915,7 +1273,7 @@ def main(page: ft.Page):
             state.liked_page = max(0, min(state.liked_page, state.liked_pages - 1))
         df_page = state.liked_page_df()
 
-        table = build_liked_table(page, state, df_page, row_offset=state.liked_page * state.liked_page_size)
+        table = build_liked_list(page, state, df_page, row_offset=state.liked_page * state.liked_page_size)
 
         # --- Page slider navigation -----------------------------------------
         pages = max(1, state.liked_pages)
@@ -929,6 +1287,7 @@ def main(page: ft.Page):
             # move to the selected page only when the user releases the thumb
             state.liked_page = int(s_page.value) - 1
             render_liked_tab()
+            page.update()
 
         s_page.on_change = on_slide
         s_page.on_change_end = on_slide_end
@@ -940,6 +1299,7 @@ def main(page: ft.Page):
                 state.liked_page_size = 300
             state.liked_page = 0
             render_liked_tab()
+            page.update()
 
         size_dd = ft.Dropdown(
             label="Rows",
@@ -962,31 +1322,28 @@ def main(page: ft.Page):
                 spacing=8,
                 controls=[
                     nav,
-                    ft.ListView(
+                    # the list scrolls vertically itself; this row only scrolls sideways
+                    ft.Row(
+                        [table],
                         expand=True,
-                        spacing=0,
-                        controls=[centered_table_container(table)],
+                        alignment=ft.MainAxisAlignment.CENTER,
+                        vertical_alignment=ft.CrossAxisAlignment.STRETCH,
+                        scroll=ft.ScrollMode.ALWAYS,
                     ),
                 ],
             ),
         )
-        page.update()
 
     def render_cols_tab():
         # Merge UI + Username on the RIGHT panel
-        names = []
-        if isinstance(state.cols_df, pd.DataFrame) and not state.cols_df.empty:
-            try:
-                names = sorted(list(state.cols_df.get("Collection Name", pd.Series(dtype=str)).dropna().astype(str).unique()))
-            except Exception:
-                names = []
+        names = state.collection_names
         dd_from = ft.Dropdown(label="From", options=[ft.dropdown.Option(n) for n in names], width=260)
         dd_into = ft.Dropdown(label="Into", options=[ft.dropdown.Option(n) for n in names], width=260)
 
         def do_merge_click(e):
             src = (dd_from.value or "").strip()
             dst = (dd_into.value or "").strip()
-            if not src or not dst or src.lower() == dst.lower():
+            if not src or not dst or src.casefold() == dst.casefold():
                 page.snack_bar = ft.SnackBar(ft.Text("Pick two different collections to merge"))
                 page.snack_bar.open = True
                 page.update()
@@ -994,11 +1351,21 @@ def main(page: ft.Page):
             df = ensure_annotation_columns(state.liked_df if isinstance(state.liked_df, pd.DataFrame) else pd.DataFrame())
             if df is None or df.empty:
                 return
-            a = df.get("Assigned Collection(s)", pd.Series(index=df.index, dtype="object")).astype(str).str.strip().str.lower() == src.lower()
-            m = df.get("Manual", pd.Series(index=df.index, dtype="object")).astype(str).str.strip().str.lower() == src.lower()
+            key = src.casefold()
+
+            def matches(col):
+                # one normalise pass per column; plain bool arrays skip index alignment in .loc
+                norm = df.get(col, pd.Series(index=df.index, dtype="object")).astype("string").str.strip().str.casefold()
+                return norm.eq(key).to_numpy(dtype=bool, na_value=False)
+
+            a = matches("Assigned Collection(s)")
+            m = matches("Manual")
             df.loc[a, "Assigned Collection(s)"] = dst
             df.loc[m, "Manual"] = dst
-            state.liked_df = df
+            if df is state.liked_df:
+                state.liked_edited()  # a rename: which rows are assigned/pending is unchanged
+            else:
+                state.liked_df = df
             state.dirty = True
             header.controls = top_stat_line(page, state).controls
             render_liked_tab()
@@ -1041,11 +1408,11 @@ def main(page: ft.Page):
             os.environ["SKETCHFAB_USER"] = state.username
             header.controls = top_stat_line(page, state).controls
             render_cols_tab()  # refresh links
-            page.update()
             try:
                 add_log("Updated Sketchfab username")
             except Exception:
                 pass
+            page.update()
         btn_user = ft.OutlinedButton("Save", on_click=save_user)
         username_card = ft.Container(
             content=ft.Row([tf_user, btn_user], spacing=8),
@@ -1055,7 +1422,7 @@ def main(page: ft.Page):
             width=420,
         )
 
-        table = build_collections_table(page, (state.cols_df if isinstance(state.cols_df, pd.DataFrame) else pd.DataFrame()), state.username)
+        table = build_collections_table(page, state, (state.cols_df if isinstance(state.cols_df, pd.DataFrame) else pd.DataFrame()))
 
         right_panel = ft.Container(
             content=ft.Column([
@@ -1086,7 +1453,18 @@ def main(page: ft.Page):
         items = [ft.Text(s, size=12) for s in reversed(state.logs)] if state.logs else [ft.Text("No events yet.")]
         log_tab.content = ft.Container(content=ft.Column(items, spacing=4, scroll=ft.ScrollMode.ALWAYS), padding=10)
 
+    renderers = [render_liked_tab, render_cols_tab, render_report_tab, render_log_tab]
+
+    def render_visible_tab() -> bool:
+        i = tabs.selected_index or 0
+        if not state.tab_dirty[i]:
+            return False
+        state.tab_dirty[i] = False
+        renderers[i]()
+        return True
+
     def render_all_tabs():
+        state.tab_dirty = [False] * 4
         render_liked_tab()
         render_cols_tab()
         render_report_tab()
@@ -1,10 +1,11 @@
 from __future__ import annotations
-import os, sys
+import math, os, sys
 sys.path.append(os.path.dirname(__file__))  # so 'from collector import ...' works
+import contextlib
 import streamlit as st
 import pandas as pd
 from collector import build_workbook
-from data_io import read_workbook, write_workbook, XL_PATH
+from data_io import read_workbook_cached, write_workbook, XL_PATH
 from matching import Terms
 from auto_assign import run_auto_assign
 from push_assignments import push
@@ -16,6 +17,9 @@ from rapidfuzz import fuzz, process
 
 TERMS_PATH = os.environ.get("TERMS_PATH", os.path.join("terms", "collections_terms.yaml"))
 logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"))
+# Copy-on-Write (pandas >= 2.0): slices handed to widgets don't need defensive copies
+with contextlib.suppress(Exception):
+    pd.set_option("mode.copy_on_write", True)
 
 st.set_page_config(page_title="Sketchfab Collections", layout="wide")
 st.title("Sketchfab Collections – v5 UI")
@@ -56,13 +60,35 @@ def toolbar():
 # --- bottom toolbar (inline; scrolls with page) ---
 st.caption("Controls")
 do_collect, do_match, overwrite, do_auto, dry_run, do_push = toolbar()
+@st.cache_data(show_spinner=False)
+def load_workbook(mtime: float):
+    # mtime is only the cache key: any save bumps it, so reruns skip the xlsx/parquet read
+    return read_workbook_cached()
+
 # Load workbook if present
 if os.path.exists(XL_PATH):
-    liked_df, cols_df = read_workbook()
+    xl_mtime = os.path.getmtime(XL_PATH)
+    liked_df, cols_df = load_workbook(xl_mtime)
 else:
+    xl_mtime = 0.0
     liked_df = pd.DataFrame()
     cols_df = pd.DataFrame()
 
+def show_paged(df: pd.DataFrame, key: str):
+    # Server-side pager: only the visible slice is serialized to the browser per rerun
+    c1, c2 = st.columns([1, 1])
+    with c1:
+        size = st.selectbox("Rows per page", [100, 300, 1000], index=1, key=f"{key}_size")
+    pages = max(1, math.ceil(len(df) / size))
+    pkey = f"{key}_page"
+    st.session_state.setdefault(pkey, 1)
+    if st.session_state[pkey] > pages:  # page size grew past the current page
+        st.session_state[pkey] = pages
+    with c2:
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=pkey)
+    start = (int(page) - 1) * size
+    st.dataframe(df.iloc[start:start + size], use_container_width=True, height=600)
+
 # Preview tabs
 tab1, tab2, tab3 = st.tabs(["Liked Models", "Collections", "Report / Terms"])
 
@@ -70,12 +96,7 @@ tab1, tab2, tab3 = st.tabs(["Liked Models", "Collections", "Report / Terms"])
 with tab1:
     if not liked_df.empty:
         st.caption(f"{len(liked_df):,} liked models")
-        show_all_l = st.toggle("Show all liked rows", value=False)
-        if show_all_l:
-            st.dataframe(liked_df, use_container_width=True, height=600)
-        else:
-            n = st.slider("Preview liked rows", 100, min(len(liked_df), 10000), 300, 100, key="liked_n")
-            st.dataframe(liked_df.head(n), use_container_width=True, height=600)
+        show_paged(liked_df, "liked")
     else:
         st.info("Run Collect to build the workbook.")
 
@@ -83,35 +104,29 @@ with tab1:
 with tab2:
     if not cols_df.empty:
         st.caption(f"{len(cols_df):,} collections")
-        show_all_c = st.toggle("Show all collections", value=False)
-        if show_all_c:
-            st.dataframe(cols_df, use_container_width=True, height=600)
-        else:
-            n2 = st.slider("Preview collections", 50, min(len(cols_df), 10000), 300, 50, key="cols_n")
-            st.dataframe(cols_df.head(n2), use_container_width=True, height=600)
+        show_paged(cols_df, "cols")
     else:
         st.info("No collections yet. Click Collect.")
 # -------- Report --------
 with tab3:
     import pandas as pd, collections, re
-    # Build a single Series of assigned values regardless of column name
+    # Unassigned == empty under either column name; no need to build the concatenated strings
     a = liked_df["Assigned Collection"] if "Assigned Collection" in liked_df.columns else pd.Series("", index=liked_df.index)
     b = liked_df["Assigned Collection(s)"] if "Assigned Collection(s)" in liked_df.columns else pd.Series("", index=liked_df.index)
-    assigned = a.fillna("").astype(str) + b.fillna("").astype(str)
-
-    pending = liked_df[assigned.str.len() == 0]
+    pending = liked_df[(a.isna() | a.eq("")) & (b.isna() | b.eq(""))]
     st.write(f"Unassigned models: **{len(pending):,}**")
 
     # ---- term mining (Name + Tags), interactive and persistent
-    def mine_terms(df, top_k=100, min_len=4, sample_n=None):
-        counter = collections.Counter()
-        if sample_n:
-            df = df.head(sample_n)
-        for _, r in df.iterrows():
-            name = (r.get("Name") or r.get("Model Name") or "")
-            tags = str(r.get("Tags") or "")
-            tokens = re.findall(r"[a-z0-9]+", (name + " " + tags).lower())
-            counter.update([t for t in tokens if len(t) >= min_len])
+    @st.cache_data(show_spinner=False)
+    def mine_terms(_df, mtime, top_k=100, min_len=4, sample_n=None):
+        # _df is not hashed; pending derives from the workbook, so its mtime stands in for it
+        df = _df.head(sample_n) if sample_n else _df
+        blank = pd.Series("", index=df.index)
+        name = df.get("Name", blank).fillna(df.get("Model Name", blank)).fillna("").astype(str)
+        tags = df.get("Tags", blank).fillna("").astype(str)
+        # one regex pass over all rows; "\n" keeps tokens from joining across rows
+        blob = "\n".join((name + " " + tags).str.lower().tolist())
+        counter = collections.Counter(re.findall(r"[a-z0-9]{%d,}" % min_len, blob))
         return pd.DataFrame(counter.most_common(top_k), columns=["term", "count"])
 
     st.subheader("Term mining")
@@ -119,17 +134,17 @@ with tab3:
     min_len = st.slider("Min token length", 3, 8, 4, key="tm_minlen")
     sample  = st.slider("Sample first N rows (speed)", 200, min(5000, len(pending) or 200), 2000, 200, key="tm_sample")
 
-    terms_df = mine_terms(pending, top_k=top_k, min_len=min_len, sample_n=sample)
+    terms_df = mine_terms(pending, xl_mtime, top_k=top_k, min_len=min_len, sample_n=sample)
     st.dataframe(terms_df, use_container_width=True)
 
     # Optional: fuzzy suggest a collection for each term
     from rapidfuzz import process, fuzz
     if not cols_df.empty and st.checkbox("Suggest target collection (fuzzy)", value=False, key="tm_fuzzy"):
         col_names = cols_df["Collection Name"].astype(str).tolist()
-        def guess(term):
-            hit = process.extractOne(term, col_names, scorer=fuzz.token_sort_ratio)
-            return hit[0] if hit and hit[1] >= 80 else ""
-        terms_df["suggested_collection"] = terms_df["term"].apply(guess)
+        # score every term against every collection in one multi-threaded call
+        scores = process.cdist(terms_df["term"].tolist(), col_names, scorer=fuzz.token_sort_ratio, workers=-1)
+        best_idx, best_score = scores.argmax(axis=1), scores.max(axis=1, initial=0)
+        terms_df["suggested_collection"] = [col_names[i] if s >= 80 else "" for i, s in zip(best_idx, best_score)]
         st.dataframe(terms_df, use_container_width=True)
 
     picked = st.multiselect("Pick terms to add", terms_df["term"].tolist(), key="tm_picked")
@@ -1,63 +1,83 @@
 from __future__ import annotations
+import contextlib
 import logging
 import pandas as pd
 # replace the top import with this try/fallback
 try:
-    from .matching import Terms, collect_signals, policy_assign
+    from .matching import Terms, collect_signals_batch, policy_assign
 except ImportError:
-    from matching import Terms, collect_signals, policy_assign
+    from matching import Terms, collect_signals_batch, policy_assign
 
 
 logger = logging.getLogger(__name__)
 
+# Copy-on-Write (pandas >= 2.0): shallow copies stay isolated from the caller's frame
+with contextlib.suppress(Exception):
+    pd.set_option("mode.copy_on_write", True)
+
 SUG_COL = "Suggested Collection(s)"
 FUZZY_COL = "Fuzzy Match Collection(s)"
 ASSIGNED_COL = "Assigned Collection(s)"
 NOTES_COL = "Assignment Notes"
 
 
-def run_auto_assign(liked_df: pd.DataFrame, terms: Terms, overwrite: bool = False) -> pd.DataFrame:
-    out = liked_df.copy()
+def run_auto_assign(liked_df: pd.DataFrame, terms: Terms, overwrite: bool = False,
+                    suggest_only: bool = False) -> pd.DataFrame:
+    # suggest_only: refresh the Suggested/Fuzzy columns and leave Assigned/Notes as they are
+    # We only add/replace whole columns, so a shallow copy is enough to leave liked_df untouched
+    out = liked_df.copy(deep=False)
 
     def to_list(x):
-        if pd.isna(x) or x is None:
+        # only reached for kept rows, which are non-null by construction; skip pd.isna's dispatch
+        if x is None:
             return []
         if isinstance(x, list):
             return x
-        return [s.strip() for s in str(x).replace(";", ",").split(",") if s.strip()]
-
-    sug_list = []
-    fuzzy_list = []
-    assigned_list = []
-    notes_list = []
+        if isinstance(x, float) and x != x:
+            return []
+        return [p for p in (s.strip() for s in str(x).replace(";", ",").split(",")) if p]
 
-    for _, row in out.iterrows():
-        name = row.get("Model Name") or ""
-        desc = row.get("Description") or ""
-        tags = [t.strip() for t in str(row.get("Tags") or "").split(",") if t.strip()]
+    # Pull the inputs out column-wise once instead of building a Series per row
+    blank = pd.Series("", index=out.index, dtype="object")
+    names = out.get("Model Name", blank).fillna("").astype(str).to_numpy()
+    descs = out.get("Description", blank).fillna("").astype(str).to_numpy()
+    tags = [[t.strip() for t in s.split(",") if t.strip()]
+            for s in out.get("Tags", blank).fillna("").astype(str).to_numpy()]
+    existing = out.get(ASSIGNED_COL, pd.Series(None, index=out.index, dtype="object"))
+    existing_col = existing.to_numpy()
+    # Rows with a manual assignment (anything besides separators/whitespace) that we must respect
+    has_existing = existing.fillna("").astype(str).str.replace(r"[\s;,]+", "", regex=True).ne("").to_numpy()
+    keep_existing = has_existing & (not overwrite)
+    notes_col = out.get(NOTES_COL, pd.Series(None, index=out.index, dtype="object")).to_numpy()
 
-        signals = collect_signals(name, desc, tags, terms)
+    all_signals = collect_signals_batch(names, descs, tags, terms)
 
-        # Persist diagnostics
-        sug = sorted(signals.tag_hits | signals.rule_hits)
-        fuzzy = [f"{k}:{v}" for k, v in sorted(signals.fuzzy_hits.items(), key=lambda kv: kv[0])]
+    # Diagnostics are gathered as lists and joined column-wise below
+    sug_rows = []
+    fuzzy_rows = []
+    assigned_list = []
+    notes_list = []
 
-        sug_list.append(", ".join(sug))
-        fuzzy_list.append(", ".join(fuzzy))
+    for signals, prev_assigned, prev_notes, keep in zip(all_signals, existing_col, notes_col, keep_existing):
+        sug_rows.append(sorted(signals.tag_hits | signals.rule_hits))
+        # keys are unique, so sorting the items sorts by collection name
+        fuzzy_rows.append([f"{k}:{v}" for k, v in sorted(signals.fuzzy_hits.items())])
+        if suggest_only:
+            continue
 
         # Respect manual assignment unless overwrite
-        existing_assigned = to_list(row.get(ASSIGNED_COL))
-        if existing_assigned and not overwrite:
-            assigned_list.append(", ".join(existing_assigned))
-            notes_list.append(row.get(NOTES_COL) or "")
+        if keep:
+            assigned_list.append(", ".join(to_list(prev_assigned)))
+            notes_list.append(prev_notes or "")
             continue
 
         pr = policy_assign(signals, terms)
         assigned_list.append(", ".join(pr.assigned))
         notes_list.append(pr.notes)
 
-    out[SUG_COL] = sug_list
-    out[FUZZY_COL] = fuzzy_list
-    out[ASSIGNED_COL] = assigned_list
-    out[NOTES_COL] = notes_list
+    out[SUG_COL] = pd.Series(sug_rows, index=out.index, dtype="object").str.join(", ")
+    out[FUZZY_COL] = pd.Series(fuzzy_rows, index=out.index, dtype="object").str.join(", ")
+    if not suggest_only:
+        out[ASSIGNED_COL] = assigned_list
+        out[NOTES_COL] = notes_list
     return out
\ No newline at end of file
@@ -1,10 +1,16 @@
 # src/collector.py
 from __future__ import annotations
-import os, sys, time, errno, msvcrt, requests, openpyxl
+import os, re, sys, errno, requests, openpyxl
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from dotenv import load_dotenv
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill
 from openpyxl.utils import get_column_letter
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 API_TOKEN = os.getenv("SKETCHFAB_TOKEN")
@@ -12,47 +18,92 @@ if not API_TOKEN:
     raise RuntimeError("SKETCHFAB_TOKEN missing (set it in .env).")
 HEADERS = {"Authorization": f"Token {API_TOKEN}"}
 
+# one keep-alive session; throttling (429) and gateway errors back off and retry instead of fixed sleeps
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(max_retries=Retry(
+    total=5, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504), respect_retry_after_header=True)))
+
 ALIASES = {"girl": "Female", "legend of zelda": "Zelda", "links awakening": "Zelda"}
+# one scan per text; longest alias first so a longer phrase wins over a prefix of it
+_ALIAS_RE = re.compile("|".join(re.escape(a) for a in sorted(ALIASES, key=len, reverse=True)))
 SINGLE_ASSIGNMENT_COLLECTIONS = {"hands", "gauntlets", "feet", "shoes"}
 
+FETCH_WORKERS = 8  # concurrent per-collection fetches; with the likes walk, stays under the session's pool of 10
+
 DATA_DIR = "data"
 os.makedirs(DATA_DIR, exist_ok=True)
 XL_PATH = os.path.join(DATA_DIR, "sketchfab_data.xlsx")
+# data_io's Parquet mirrors of this workbook; stale as soon as it is rebuilt here
+SIDECAR_PATHS = (XL_PATH + ".liked.parquet", XL_PATH + ".cols.parquet")
 
 def _check_file_not_open(filepath: str) -> None:
+    # opening for write already fails while Excel holds the file; the byte lock is a Windows-only extra
     try:
         with open(filepath, "r+b") as f:
-            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
-            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            if sys.platform == "win32":
+                import msvcrt
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    except FileNotFoundError:
+        pass
     except OSError as e:
-        if e.errno == errno.EACCES:
+        if isinstance(e, PermissionError) or e.errno == errno.EACCES:
             print(f"✖ '{filepath}' is open. Close it and rerun."); sys.exit(1)
 
-def _auto_format(ws) -> None:
-    for col in ws.columns:
-        max_len = max((len(str(c.value or "")) for c in col), default=10)
-        ws.column_dimensions[get_column_letter(col[0].column)].width = min(max_len + 2, 60)
+_HEADER_FONT = Font(bold=True)
+_HEADER_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+
+def _column_widths(rows) -> list[int]:
+    # one pass over plain values: longest str per column, +2, capped at 60
+    widths: list[int] = []
+    for row in rows:
+        if len(row) > len(widths): widths.extend([0] * (len(row) - len(widths)))
+        for i, v in enumerate(row):
+            n = len(str(v or ""))
+            if n > widths[i]: widths[i] = n
+    return [min(w + 2, 60) for w in widths]
+
+def _stream_sheet(ws, headers: list[str], rows: list[list], links: list[str], fill_collections=False) -> None:
+    """Write-only sheet: widths/freeze go in before the rows, then every row streams out once.
+    links[i] becomes the hyperlink on column 1 of rows[i]."""
+    for i, w in enumerate(_column_widths([headers] + rows), 1):
+        ws.column_dimensions[get_column_letter(i)].width = w
     ws.freeze_panes = "A2"
+    head = []
+    for h in headers:
+        c = WriteOnlyCell(ws, value=h); c.font = _HEADER_FONT
+        if fill_collections and "Collection" in h: c.fill = _HEADER_FILL
+        head.append(c)
+    ws.append(head)
+    for row, url in zip(rows, links):
+        first = WriteOnlyCell(ws, value=row[0]); first.hyperlink = url
+        ws.append([first, *row[1:]])
 
-def _remove_trailing_empty(ws) -> None:
-    while ws.max_row > 1 and all(cell.value in (None, "") for cell in ws[ws.max_row]):
-        ws.delete_rows(ws.max_row)
-    while ws.max_column > 1 and all(ws.cell(row=r, column=ws.max_column).value in (None, "") for r in range(1, ws.max_row + 1)):
-        ws.delete_cols(ws.max_column)
+def _open_for_scan(path):
+    # read_only streams rows off the zip instead of materialising every Cell; close() when done
+    return openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
 
 def _load_existing_columns(path=XL_PATH) -> dict:
     if not os.path.exists(path): return {}
-    wb = openpyxl.load_workbook(path)
+    wb = _open_for_scan(path)
+    try:
+        return _scan_existing_columns(wb)
+    finally:
+        wb.close()
+
+def _scan_existing_columns(wb) -> dict:
     if "Liked Models" not in wb.sheetnames: return {}
     ws = wb["Liked Models"]
-    headers = [c.value for c in ws[1]]
+    headers = list(next(ws.iter_rows(max_row=1, values_only=True), ()))
     def idx(name): return headers.index(name) if name in headers else -1
     i_assigned = idx("Assigned Collection")
     i_auto     = idx("Auto-Assigned Collection(s)")
     i_sug      = idx("Suggested Collection(s)")
     i_fuzzy    = idx("Fuzzy Matched Collection(s)")
     out = {}
-    for row in ws.iter_rows(min_row=2, values_only=True):
+    # max_col pads read_only rows (which otherwise stop at their last written cell)
+    for row in ws.iter_rows(min_row=2, max_col=max(len(headers), 2), values_only=True):
         uid = row[1]
         if not uid: continue
         out[uid] = {
@@ -66,16 +117,19 @@ def _load_existing_columns(path=XL_PATH) -> dict:
 def _load_assigned_collections(path=XL_PATH) -> dict[str, list[str]]:
     assigned = {}
     if not os.path.exists(path): return assigned
-    wb = openpyxl.load_workbook(path)
-    if "Liked Models" not in wb.sheetnames: return assigned
-    for row in wb["Liked Models"].iter_rows(min_row=2, values_only=True):
-        uid, assigned_str = row[1], row[2]
-        if uid and assigned_str:
-            assigned[uid] = [c.strip() for c in str(assigned_str).split(",") if c.strip()]
+    wb = _open_for_scan(path)
+    try:
+        if "Liked Models" not in wb.sheetnames: return assigned
+        for row in wb["Liked Models"].iter_rows(min_row=2, max_col=3, values_only=True):
+            uid, assigned_str = row[1], row[2]
+            if uid and assigned_str:
+                assigned[uid] = [c.strip() for c in str(assigned_str).split(",") if c.strip()]
+    finally:
+        wb.close()
     return assigned
 
 def _get(url: str):
-    r = requests.get(url, headers={"Authorization": f"Token {API_TOKEN}"}, timeout=15)
+    r = SESSION.get(url, timeout=15)
     r.raise_for_status(); return r
 
 def get_likes() -> list[dict]:
@@ -84,7 +138,7 @@ def get_likes() -> list[dict]:
         r = _get(url); data = r.json()
         likes.extend(data.get("results", [])); page += 1
         print(f"Fetched likes page {page}: +{len(data.get('results', []))} → total {len(likes)}")
-        url = data.get("next"); time.sleep(0.1)
+        url = data.get("next")
     return likes
 
 def get_collections() -> list[dict]:
@@ -93,7 +147,7 @@ def get_collections() -> list[dict]:
         r = _get(url); data = r.json()
         cols.extend(data.get('results', [])); page += 1
         print(f"Fetched collections page {page}: +{len(data.get('results', []))} → total {len(cols)}")
-        url = data.get('next'); time.sleep(0.05)
+        url = data.get('next')
     return cols
 
 def get_models_in_collection(uid: str) -> list[dict]:
@@ -104,69 +158,115 @@ def get_models_in_collection(uid: str) -> list[dict]:
         url = data.get('next')
     return models
 
-def build_uid_to_collections_map() -> dict[str, list[str]]:
+def fetch_collection_models(cols: list[dict]) -> dict[str, list[dict]]:
+    # collection uid -> its models; the per-collection fetches overlap
+    uids = [c["uid"] for c in cols]
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        return dict(zip(uids, ex.map(get_models_in_collection, uids)))
+
+def build_uid_to_collections_map(cols: list[dict] | None = None,
+                                 cols_models: dict[str, list[dict]] | None = None) -> dict[str, list[str]]:
     print("📥 Fetching all collections and their models...")
+    if cols is None: cols = get_collections()
+    if cols_models is None: cols_models = fetch_collection_models(cols)
     mapping: dict[str, list[str]] = {}
-    for col in get_collections():
-        for m in get_models_in_collection(col["uid"]):
+    for col in cols:  # collection order, so each model's name list keeps its order
+        for m in cols_models[col["uid"]]:
             mapping.setdefault(m["uid"], []).append(col["name"])
     print("✅ Collection mapping complete."); return mapping
 
 def _apply_aliases(text: str) -> str:
-    for a, canon in ALIASES.items(): text = text.replace(a, canon)
-    return text
-
-def _fuzzy_match_collections(tags: list[dict], collections: list[str]) -> str:
-    import difflib
-    tag_names = [t["name"].lower() for t in tags]
-    matched: set[str] = set()
-    for tag in tag_names:
-        for m in difflib.get_close_matches(tag, [c.lower() for c in collections], cutoff=0.7):
-            for c in collections:
-                if c.lower() == m: matched.add(c)
-    return ", ".join(sorted(matched))
-
-def _suggest_collections(name: str, tags: list[dict], collections: list[str]) -> str:
+    return _ALIAS_RE.sub(lambda m: ALIASES[m.group(0)], text)
+
+def _fuzzy_tag_hits(tag_names, coll_lower: list[str]) -> dict[str, set[str]]:
+    # was difflib.get_close_matches(tag, ..., cutoff=0.7) per tag: one rapidfuzz matrix over the
+    # lowercased tags, keeping each tag's best 3 (lowercased) collections at ratio >= 70
+    tag_names = list(tag_names)
+    if not tag_names or not coll_lower: return {t: set() for t in tag_names}
+    scores = process.cdist(tag_names, coll_lower, scorer=fuzz.ratio, score_cutoff=70, workers=-1)
+    top = np.argsort(-scores, axis=1, kind="stable")[:, :3]
+    return {t: {coll_lower[j] for j in idx if row[j] > 0} for t, row, idx in zip(tag_names, scores, top)}
+
+def _fuzzy_match_collections(tags: list[dict], collections: list[str], coll_lower: list[str] | None = None,
+                             tag_hits: dict[str, set[str]] | None = None) -> str:
+    if not tags or not collections: return ""
+    if coll_lower is None: coll_lower = [c.lower() for c in collections]
+    names = [t["name"].lower() for t in tags]
+    if tag_hits is None: tag_hits = _fuzzy_tag_hits(set(names), coll_lower)
+    hit = set().union(*(tag_hits[n] for n in names))
+    return ", ".join(sorted(c for c, low in zip(collections, coll_lower) if low in hit))
+
+def _suggest_collections(name: str, tags: list[dict], collections: list[str], coll_lower: list[str] | None = None,
+                         tag_cache: dict[str, frozenset[int]] | None = None) -> str:
+    # tag_cache: lowercased tag -> indices of the collections its aliased text contains (shared across rows)
+    if coll_lower is None: coll_lower = [c.lower() for c in collections]
+    cache = {} if tag_cache is None else tag_cache
     name = _apply_aliases((name or "").lower())
-    tag_names = [_apply_aliases(t["name"].lower()) for t in tags]
-    hits = [c for c in collections if c.lower() in name or any(c.lower() in t for t in tag_names)]
-    return ", ".join(hits)
-
-def _auto_assign(tags_str: str, suggested_str: str, fuzzy_str: str) -> str:
-    tags      = [t.strip().lower() for t in (tags_str or "").split(",") if t.strip()]
-    suggested = [s.strip().lower() for s in (suggested_str or "").split(",") if s.strip()]
-    fuzzy     = [f.strip().lower() for f in (fuzzy_str or "").split(",") if f.strip()]
-    all_cands = set(tags + suggested + fuzzy)
-    votes = {c: sum([c in tags, c in suggested, c in fuzzy]) for c in all_cands}
-    strong = [c for c, n in votes.items() if n == 3]
-    singles = [c for c in strong if c in SINGLE_ASSIGNMENT_COLLECTIONS]
-    if len(singles) == 1: return singles[0]
-    if len(singles) > 1:  return ""
-    return ", ".join(sorted(strong))
-
-def _get_collection_names() -> list[str]:
-    return [c["name"] for c in get_collections()]
+    hit = {i for i, low in enumerate(coll_lower) if low in name}
+    for t in tags:
+        key = t["name"].lower()
+        if key not in cache:
+            text = _apply_aliases(key)
+            cache[key] = frozenset(i for i, low in enumerate(coll_lower) if low in text)
+        hit |= cache[key]
+    return ", ".join(c for i, c in enumerate(collections) if i in hit)
+
+def _pieces(s: str) -> list[str]:
+    return [p.strip().lower() for p in (s or "").split(",") if p.strip()]
+
+def _auto_assign_all(tags_strs: list[str], suggested_strs: list[str], fuzzy_strs: list[str]) -> list[str]:
+    """Per row: the candidates named in all three of tags/suggested/fuzzy (lowercased). A lone
+    single-assignment hit wins, several of them cancel out, else the sorted hits are joined.
+    Votes are counted for all rows at once on (rows x candidates) presence matrices."""
+    n = len(tags_strs)
+    sug = [_pieces(x) for x in suggested_strs]
+    fuz = [_pieces(x) for x in fuzzy_strs]
+    # a strong hit must be suggested and fuzzy, so those pieces are the whole vocabulary;
+    # sorted, so a row's hits come out of flatnonzero already in order
+    vocab = sorted({c for row in sug for c in row} | {c for row in fuz for c in row})
+    if not vocab: return [""] * n
+    col = {c: k for k, c in enumerate(vocab)}
+
+    def presence(rows: list[list[str]]) -> np.ndarray:
+        mat = np.zeros((n, len(vocab)), dtype=np.uint8)
+        pairs = [(i, col[c]) for i, row in enumerate(rows) for c in row if c in col]
+        if pairs:
+            r, k = zip(*pairs); mat[list(r), list(k)] = 1
+        return mat
+
+    votes = presence([_pieces(x) for x in tags_strs]) + presence(sug) + presence(fuz)
+    strong = votes == 3
+    is_single = np.array([c in SINGLE_ASSIGNMENT_COLLECTIONS for c in vocab])
+    n_single = (strong & is_single).sum(axis=1)
+    out = [""] * n
+    for i in np.flatnonzero(strong.any(axis=1)):
+        if n_single[i] == 1: out[i] = vocab[int(np.flatnonzero(strong[i] & is_single)[0])]
+        elif n_single[i] == 0: out[i] = ", ".join(vocab[k] for k in np.flatnonzero(strong[i]))
+    return out
+
+def _get_collection_names(cols: list[dict] | None = None) -> list[str]:
+    return [c["name"] for c in (get_collections() if cols is None else cols)]
 
 def _write_liked_models_sheet(wb: Workbook, likes, uid2cols, assigned_map, col_names) -> None:
-    ws = wb.active; ws.title = "Liked Models"
+    ws = wb.create_sheet("Liked Models")
     headers = [
         "Name","UID","Assigned Collection","Already In Collection(s)","Auto-Assigned Collection(s)",
         "Suggested Collection(s)","Fuzzy Matched Collection(s)","Tags","Author","License","Downloadable"
     ]
-    ws.append(headers)
-    for cell in ws[1]:
-        cell.font = Font(bold=True)
-        if "Collection" in (cell.value or ""):
-            cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+    rows, links = [], []
 
     prev_cols = _load_existing_columns()
-    for m in likes:
-        name = m.get("name"); uid = m.get("uid"); tags = m.get("tags", [])
-        tag_str = ", ".join(t["name"] for t in tags)
+    coll_lower = [c.lower() for c in col_names]
+    # every distinct tag in the likes is fuzzy-scored against the collections in one call
+    fuzzy_hits = _fuzzy_tag_hits({t["name"].lower() for m in likes for t in m.get("tags", [])}, coll_lower)
+    contains: dict[str, frozenset[int]] = {}
+    tag_strs = [", ".join(t["name"] for t in m.get("tags", [])) for m in likes]
+    sug_strs = [_suggest_collections(m.get("name"), m.get("tags", []), col_names, coll_lower, contains) for m in likes]
+    fuzzy_strs = [_fuzzy_match_collections(m.get("tags", []), col_names, coll_lower, fuzzy_hits) for m in likes]
+    autos = _auto_assign_all(tag_strs, sug_strs, fuzzy_strs)
+    for m, tag_str, suggested, fuzzy, auto in zip(likes, tag_strs, sug_strs, fuzzy_strs, autos):
+        name = m.get("name"); uid = m.get("uid")
         already_in = ", ".join(uid2cols.get(uid, []))
-        suggested = _suggest_collections(name, tags, col_names)
-        fuzzy = _fuzzy_match_collections(tags, col_names)
-        auto = _auto_assign(tag_str, suggested, fuzzy)
 
         prev = prev_cols.get(uid, {})
         assigned_val  = prev.get("assigned", "")
@@ -180,36 +280,45 @@ def _write_liked_models_sheet(wb: Workbook, likes, uid2cols, assigned_map, col_n
         author = (m.get("user") or {}).get("displayName", "")
         url = m.get("viewerUrl") or f"https://sketchfab.com/3d-models/{uid}"
 
-        ws.append([name, uid, assigned_val, already_in, auto_val, suggested_val, fuzzy_val,
-                   tag_str, author, lic_str, "Yes" if is_dl else "No"])
-        ws.cell(row=ws.max_row, column=1).hyperlink = url
+        rows.append([name, uid, assigned_val, already_in, auto_val, suggested_val, fuzzy_val,
+                     tag_str, author, lic_str, "Yes" if is_dl else "No"])
+        links.append(url)
 
-    _auto_format(ws)
+    _stream_sheet(ws, headers, rows, links, fill_collections=True)
 
-def _write_collections_sheet(wb: Workbook) -> None:
+def _write_collections_sheet(wb: Workbook, cols: list[dict], cols_models: dict[str, list[dict]]) -> None:
     ws = wb.create_sheet("Collections")
-    ws.append(["Collection Name","Collection UID","Model Count","Model Names"])
-    for col in get_collections():
-        models = get_models_in_collection(col["uid"])
+    rows, links = [], []
+    for col in cols:
+        models = cols_models[col["uid"]]
         names = sorted([m.get("name","") for m in models])
-        ws.append([col["name"], col["uid"], len(names), ", ".join(names)])
-        ws.cell(row=ws.max_row, column=1).hyperlink = f"https://sketchfab.com/collections/{col['uid']}"
-    _auto_format(ws)
+        rows.append([col["name"], col["uid"], len(names), ", ".join(names)])
+        links.append(f"https://sketchfab.com/collections/{col['uid']}")
+    _stream_sheet(ws, ["Collection Name","Collection UID","Model Count","Model Names"], rows, links)
 
 def build_workbook() -> str:
     _check_file_not_open(XL_PATH)
-    likes = get_likes()
-    uid2cols = build_uid_to_collections_map()
+    # the likes walk is independent of the collection fetches, so it runs alongside them
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        likes_fut = ex.submit(get_likes)
+        # one pass over the collections API; both sheets reuse it
+        cols = get_collections()
+        cols_models = fetch_collection_models(cols)
+        likes = likes_fut.result()
+    uid2cols = build_uid_to_collections_map(cols, cols_models)
     assigned = _load_assigned_collections()
-    col_names = _get_collection_names()
+    col_names = _get_collection_names(cols)
 
-    wb = Workbook()
+    # write_only: rows stream to disk on save instead of living as Cell objects.
+    # Every row carries a UID and the headers are non-empty, so there is nothing to trim.
+    wb = Workbook(write_only=True)
     _write_liked_models_sheet(wb, likes, uid2cols, assigned, col_names)
-    _write_collections_sheet(wb)
-    for sheet in wb.worksheets:
-        _remove_trailing_empty(sheet)
+    _write_collections_sheet(wb, cols, cols_models)
 
     wb.save(XL_PATH)
+    for p in SIDECAR_PATHS:
+        try: os.remove(p)
+        except FileNotFoundError: pass
     print(f"✔ Saved to {XL_PATH}")
     return XL_PATH
 
@@ -1,18 +1,40 @@
 from __future__ import annotations
+import contextlib
+import importlib.util
 import os
 import logging
+import shutil
+import tempfile
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 
+try:  # optional, faster writer; columns are sized during the write, so no reload pass
+    import xlsxwriter  # noqa: F401
+    XL_ENGINE = "xlsxwriter"
+except ImportError:
+    XL_ENGINE = "openpyxl"
+
+# optional Parquet engine (pip install pyarrow); without one only the xlsx is written and read
+PARQUET_ENGINE = next((m for m in ("pyarrow", "fastparquet") if importlib.util.find_spec(m)), None)
+
+try:
+    from .paths import DATA_DIR
+except ImportError:
+    from paths import DATA_DIR
+
 logger = logging.getLogger(__name__)
 
-DATA_DIR = os.environ.get("DATA_DIR", "data")
 XL_PATH = os.path.join(DATA_DIR, "sketchfab_data.xlsx")
 
 LIKED_SHEET = "Liked Models"
 COLL_SHEET = "Collections"
 
+# Parquet mirrors of the two sheets (optional, needs pyarrow); much faster to load than xlsx
+LIKED_PARQUET = XL_PATH + ".liked.parquet"
+COLL_PARQUET = XL_PATH + ".cols.parquet"
+
 os.makedirs(DATA_DIR, exist_ok=True)
 
 
@@ -29,7 +51,12 @@ def write_workbook(liked_df: pd.DataFrame, collections_df: pd.DataFrame) -> None
     # Normalize Tags column if present
     if "Tags" in liked_out.columns:
         try:
-            liked_out["Tags"] = liked_out["Tags"].apply(lambda x: ", ".join(x) if isinstance(x, list) else (x or ""))
+            tags = liked_out["Tags"]
+            is_list = tags.map(type).isin((list, tuple))
+            if is_list.any():
+                tags = tags.copy()
+                tags[is_list] = tags[is_list].str.join(", ")
+            liked_out["Tags"] = tags.fillna("")
         except Exception:
             pass
 
@@ -37,30 +64,101 @@ def write_workbook(liked_df: pd.DataFrame, collections_df: pd.DataFrame) -> None
 
     # Optional: bring forward pipeline-specific columns when using that schema
     if os.path.exists(XL_PATH) and ("Model UID" in liked_out.columns):
+        carry_cols = [
+            c for c in ("Suggested Collection(s)", "Fuzzy Match Collection(s)",
+                        "Assigned Collection(s)", "Assignment Notes")
+            if c in liked_out.columns
+        ]
         try:
-            existing = pd.ExcelFile(XL_PATH)
-            if LIKED_SHEET in existing.sheet_names:
-                prev = existing.parse(LIKED_SHEET)
-                if ("Model UID" in prev.columns):
-                    carry_cols = [
-                        "Suggested Collection(s)",
-                        "Fuzzy Match Collection(s)",
-                        "Assigned Collection(s)",
-                        "Assignment Notes",
-                    ]
-                    prev_idx = prev.set_index("Model UID")
-                    for col in carry_cols:
-                        if col in prev_idx.columns and col in liked_out.columns:
-                            m = prev_idx[col].to_dict()
-                            liked_out[col] = liked_out["Model UID"].map(m)
+            with pd.ExcelFile(XL_PATH) as existing:
+                # only the UID and carried columns are parsed; the rest of the old sheet is skipped
+                prev = (existing.parse(LIKED_SHEET, usecols=lambda c: c == "Model UID" or c in carry_cols)
+                        if carry_cols and LIKED_SHEET in existing.sheet_names else None)
+            if prev is not None and "Model UID" in prev.columns:
+                carry = [c for c in carry_cols if c in prev.columns]
+                if carry:
+                    # one UID join for every carried column (last row wins, as with to_dict)
+                    prev_rows = (prev.drop_duplicates("Model UID", keep="last")
+                                 .set_index("Model UID")[carry]
+                                 .reindex(liked_out["Model UID"]))
+                    for col in carry:
+                        liked_out[col] = prev_rows[col].to_numpy()
         except Exception as e:
             logger.warning("Could not preserve previous columns: %s", e)
 
-    with pd.ExcelWriter(XL_PATH, engine="openpyxl") as xw:
-        liked_out.to_excel(xw, index=False, sheet_name=LIKED_SHEET)
-        cols_out.to_excel(xw, index=False, sheet_name=COLL_SHEET)
+    # Write beside the target and swap in, so an interrupted save never leaves a torn workbook
+    liked_out, cols_out = _trim_blank_tail(liked_out), _trim_blank_tail(cols_out)
+    with _replacing(XL_PATH) as tmp_path:
+        with pd.ExcelWriter(tmp_path, engine=XL_ENGINE) as xw:
+            for name, df in ((LIKED_SHEET, liked_out), (COLL_SHEET, cols_out)):
+                df.to_excel(xw, index=False, sheet_name=name)
+                if XL_ENGINE == "xlsxwriter":
+                    ws = xw.sheets[name]
+                    for c, w in enumerate(_frame_widths(df)):
+                        ws.set_column(c, c, w)
+
+        if XL_ENGINE != "xlsxwriter":
+            _finalize_workbook(tmp_path, [LIKED_SHEET, COLL_SHEET])
+    _write_sidecars(liked_out, cols_out)
+
+
+@contextlib.contextmanager
+def _replacing(path: str):
+    """Yield a fresh temp path beside `path`; on success it replaces `path`, else it is removed.
+    Each writer gets its own temp file, so concurrent saves can't clobber each other's output."""
+    root, ext = os.path.splitext(os.path.basename(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{root}.", suffix=f".tmp{ext}", dir=os.path.dirname(path) or ".")
+    os.close(fd)
+    try:
+        if os.path.exists(path):  # mkstemp creates 0600; keep the target's permissions
+            shutil.copymode(path, tmp_path)
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+
 
-    _finalize_workbook(XL_PATH, [LIKED_SHEET, COLL_SHEET])
+def _write_sidecars(liked: pd.DataFrame, cols: pd.DataFrame) -> None:
+    # Best effort: if either frame can't be written, drop both so a stale mirror is never read
+    if PARQUET_ENGINE is None:
+        drop_sidecars()
+        return
+    try:
+        with _replacing(LIKED_PARQUET) as tmp:
+            liked.to_parquet(tmp, index=False, engine=PARQUET_ENGINE)
+        with _replacing(COLL_PARQUET) as tmp:
+            cols.to_parquet(tmp, index=False, engine=PARQUET_ENGINE)
+    except Exception as e:
+        logger.warning("Parquet sidecar skipped: %s", e)
+        drop_sidecars()
+
+
+def drop_sidecars() -> None:
+    """Remove the Parquet mirrors; call after writing XL_PATH by any other means than write_workbook."""
+    for p in (LIKED_PARQUET, COLL_PARQUET):
+        with contextlib.suppress(OSError):
+            os.remove(p)
+
+
+def _trim_blank_tail(df: pd.DataFrame) -> pd.DataFrame:
+    # trailing rows with every cell empty would only be written to be trimmed again
+    if df.empty:
+        return df
+    keep = np.flatnonzero(~(df.isna() | df.eq("")).all(axis=1).to_numpy())
+    n = keep[-1] + 1 if len(keep) else 0
+    return df if n == len(df) else df.iloc[:n]
+
+
+def _frame_widths(df: pd.DataFrame) -> list[int]:
+    # same rule as _finalize_workbook (longest str incl. header, +2, cap 60), from the frame itself
+    widths = []
+    for col in df.columns:
+        s = df[col]
+        s = s[s.notna()]
+        ln = int(s.astype(str).str.len().max()) if len(s) else 0
+        widths.append(min(max(len(str(col)), ln) + 2, 60))
+    return widths
 
 
 def _finalize_workbook(path: str, sheets: list[str]) -> None:
@@ -69,26 +167,27 @@ def _finalize_workbook(path: str, sheets: list[str]) -> None:
         if name not in wb.sheetnames:
             continue
         ws = wb[name]
-        # Trim trailing blank rows
-        max_row = ws.max_row
-        max_col = ws.max_column
-        while max_row > 1 and all((ws.cell(row=max_row, column=c).value in (None, "")) for c in range(1, max_col + 1)):
-            ws.delete_rows(max_row)
-            max_row -= 1
-        # Trim trailing blank cols
-        while max_col > 1 and all((ws.cell(row=r, column=max_col).value in (None, "")) for r in range(1, max_row + 1)):
-            ws.delete_cols(max_col)
-            max_col -= 1
+        # One pass over the values: per-column max len plus the last non-blank row/col
+        widths = [0] * ws.max_column
+        last_row = last_col = 1
+        for r, row in enumerate(ws.iter_rows(values_only=True), 1):
+            for c, v in enumerate(row, 1):
+                if v in (None, ""):
+                    continue
+                ln = len(str(v))
+                if ln > widths[c - 1]:
+                    widths[c - 1] = ln
+                last_row = r
+                if c > last_col:
+                    last_col = c
+        # Trim trailing blank rows/cols
+        if ws.max_row > last_row:
+            ws.delete_rows(last_row + 1, ws.max_row - last_row)
+        if ws.max_column > last_col:
+            ws.delete_cols(last_col + 1, ws.max_column - last_col)
         # Auto-size columns (cap width at 60)
-        for c in range(1, ws.max_column + 1):
-            letter = get_column_letter(c)
-            max_len = 0
-            for r in range(1, ws.max_row + 1):
-                v = ws.cell(row=r, column=c).value
-                ln = len(str(v)) if v is not None else 0
-                if ln > max_len:
-                    max_len = ln
-            ws.column_dimensions[letter].width = min(max_len + 2, 60)
+        for c, w in enumerate(widths[:last_col], 1):
+            ws.column_dimensions[get_column_letter(c)].width = min(w + 2, 60)
     wb.save(path)
 
 
@@ -99,3 +198,23 @@ def read_workbook() -> tuple[pd.DataFrame, pd.DataFrame]:
     liked = x.parse(LIKED_SHEET)
     cols = x.parse(COLL_SHEET)
     return liked, cols
+
+
+def read_workbook_cached() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Like read_workbook, but loads the Parquet sidecars when they are newer than
+    the xlsx (e.g. not edited in Excel since the last save)."""
+    if PARQUET_ENGINE is None:
+        return read_workbook()
+    try:
+        xl_mtime = os.path.getmtime(XL_PATH)
+        if os.path.getmtime(LIKED_PARQUET) >= xl_mtime and os.path.getmtime(COLL_PARQUET) >= xl_mtime:
+            return (pd.read_parquet(LIKED_PARQUET, engine=PARQUET_ENGINE),
+                    pd.read_parquet(COLL_PARQUET, engine=PARQUET_ENGINE))
+        logger.debug("Parquet sidecars older than %s; reading the workbook", XL_PATH)
+    except OSError as e:  # no workbook / sidecar yet, or one went missing mid-read
+        logger.debug("Parquet sidecars unavailable: %s", e)
+    except ImportError as e:  # no pyarrow / fastparquet engine
+        logger.debug("Parquet engine unavailable: %s", e)
+    except ValueError as e:  # truncated or otherwise unreadable sidecar (ArrowInvalid is a ValueError)
+        logger.warning("Ignoring unreadable Parquet sidecar: %s", e)
+    return read_workbook()
@@ -0,0 +1,13 @@
+# frames.py -- small DataFrame helpers shared by the GUI state and the pipeline steps
+from __future__ import annotations
+from typing import Dict
+
+import pandas as pd
+
+
+def collection_name_map(collections_df: pd.DataFrame | None) -> Dict[str, str]:
+    """Collection name -> uid, skipping rows missing either (later rows win on duplicate names)."""
+    if collections_df is None or not {"Collection Name", "Collection UID"} <= set(collections_df.columns):
+        return {}
+    pairs = collections_df[["Collection Name", "Collection UID"]].dropna()
+    return dict(zip(pairs["Collection Name"].to_numpy(), pairs["Collection UID"].to_numpy()))
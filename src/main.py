@@ -15,6 +15,7 @@ from collector import build_workbook  # assumes your collector exposes this
 from matching import Terms
 from auto_assign import run_auto_assign
 from push_assignments import push
+from sketchfab_client import SketchfabClient
 from merge_collections import interactive_merge
 print("MAIN FILE:", __file__)
 
@@ -155,8 +156,10 @@ def main(page: ft.Page):
         state.busy = True; page.splash = ft.ProgressBar(); page.update()
         try:
             info(f"Pushing Assigned to Sketchfab (dry_run={dry_run_ref.value})…")
-            likes, colls = read_workbook()
-            res = push(likes, colls, dry_run=dry_run_ref.value)
+            likes, _ = read_workbook()
+            # collections as loaded/merged in this session; their name -> uid map is kept on the state
+            res = push(likes, state.colls_df, SketchfabClient(), dry_run=dry_run_ref.value,
+                       name_to_uid=state.name_to_uid)
             info(f"Push result: {res}")
         finally:
             state.busy = False; page.splash = None; page.update()
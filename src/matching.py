@@ -1,12 +1,20 @@
 from __future__ import annotations
+import os
 import re
 import logging
+from functools import lru_cache
 import typing as t
 from dataclasses import dataclass
 
+import numpy as np
 import yaml
 from rapidfuzz import fuzz, process
 
+try:  # optional: one Aho-Corasick scan per text for the substring guards
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -21,24 +29,135 @@ class PolicyResult:
     notes: str
 
 
+@dataclass
+class CollectionRule:
+    """One collection's term config, lowercased and compiled once per Terms."""
+    name: str
+    include_terms: frozenset[str]
+    tag_terms: frozenset[str]
+    exclude_re: t.Optional[re.Pattern]
+    fuzzy_threshold: int
+    include_list: tuple[str, ...] = ()  # include_terms in a fixed order, ready for the fuzzy scorers
+
+
+def _substring_re(words: t.Iterable[str]) -> t.Optional[re.Pattern]:
+    # one alternation == any(w in text for w in words), in a single scan
+    words = sorted(set(words), key=len, reverse=True)
+    if not words:
+        return None
+    return re.compile("|".join(map(re.escape, words)))
+
+
+def _automaton(payloads: dict[str, int]):
+    # term -> int payload; None when pyahocorasick is missing or "" would need the regex semantics
+    if ahocorasick is None or not payloads or "" in payloads:
+        return None
+    a = ahocorasick.Automaton()
+    for w, v in payloads.items():
+        a.add_word(w, v)
+    a.make_automaton()
+    return a
+
+
+_WORD_BITS = 64  # collection hit bits per uint64 mask word; rule i lives in word i // 64
+_WORD_ALL = (1 << _WORD_BITS) - 1
+_FUZZY_BLOCK_ROWS = 4096  # rows per cdist call; bounds the rows x terms score matrix
+
+
 class Terms:
     def __init__(self, cfg: dict):
         self.single = set(cfg.get("single_assignment_collections", []) or [])
         self.negative = set(map(str.lower, cfg.get("negative_terms", []) or []))
         self.collections: dict[str, dict] = cfg.get("collections", {})
+        self.negative_re = _substring_re(self.negative)
+        self.rules = [
+            CollectionRule(
+                name=coll_name,
+                include_terms=frozenset(s.lower() for s in (c.get("include_terms") or [])),
+                tag_terms=frozenset(s.lower() for s in (c.get("tag_terms") or [])),
+                exclude_re=_substring_re(s.lower() for s in (c.get("exclude_terms") or [])),
+                fuzzy_threshold=int(c.get("fuzzy_threshold", 88)),
+                include_list=tuple(sorted({s.lower() for s in (c.get("include_terms") or [])})),
+            )
+            for coll_name, c in self.collections.items()
+        ]
+        # Substring guards as automata: negative terms, and exclude term -> bitmask of rules it excludes
+        self.negative_ac = _automaton(dict.fromkeys(self.negative, 0))
+        excl: dict[str, int] = {}
+        for i, c in enumerate(self.collections.values()):
+            for w in (c.get("exclude_terms") or []):
+                excl[w.lower()] = excl.get(w.lower(), 0) | (1 << i)
+        self.exclude_ac = _automaton(excl)
+        # Term id -> bitmask of the rules (bit i == self.rules[i]) listing it; id 0 is a no-op pad
+        self.term_ids: dict[str, int] = {}
+        for rule in self.rules:
+            for w in rule.include_terms | rule.tag_terms:
+                self.term_ids.setdefault(w, len(self.term_ids) + 1)
+        self.mask_words = -(-len(self.rules) // _WORD_BITS)
+        self.include_bits = np.zeros((len(self.term_ids) + 1, self.mask_words), dtype=np.uint64)
+        self.tag_bits = np.zeros((len(self.term_ids) + 1, self.mask_words), dtype=np.uint64)
+        for i, rule in enumerate(self.rules):
+            word, bit = divmod(i, _WORD_BITS)
+            bit = np.uint64(1 << bit)
+            for w in rule.include_terms:
+                self.include_bits[self.term_ids[w], word] |= bit
+            for w in rule.tag_terms:
+                self.tag_bits[self.term_ids[w], word] |= bit
+        # Every rule's include terms back to back; fuzzy_rules[k] owns terms_flat[term_offsets[k]:...]
+        self.fuzzy_rules = [i for i, rule in enumerate(self.rules) if rule.include_list]
+        self.terms_flat = [w for i in self.fuzzy_rules for w in self.rules[i].include_list]
+        self.term_offsets = np.cumsum([0] + [len(self.rules[i].include_list) for i in self.fuzzy_rules[:-1]])
+        self.min_fuzzy_threshold = min((self.rules[i].fuzzy_threshold for i in self.fuzzy_rules), default=0)
+
+    def is_negative(self, text: str) -> bool:
+        if self.negative_ac is not None:
+            return next(self.negative_ac.iter(text), None) is not None
+        return self.negative_re is not None and self.negative_re.search(text) is not None
+
+    def excluded_bits(self, text: str) -> int:
+        """Bit i set when self.rules[i] has an exclude term occurring in text."""
+        bits = 0
+        if self.exclude_ac is not None:
+            for _, b in self.exclude_ac.iter(text):
+                bits |= b
+            return bits
+        for i, rule in enumerate(self.rules):
+            if rule.exclude_re is not None and rule.exclude_re.search(text):
+                bits |= 1 << i
+        return bits
 
     @classmethod
     def from_yaml(cls, path: str) -> "Terms":
+        """Load terms from YAML, reusing the compiled rules until the file changes.
+
+        The returned Terms is shared between callers: treat it as read-only.
+        """
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        cached = _TERMS_CACHE.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         with open(path, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f) or {}
-        return cls(data)
+        terms = cls(data)
+        _TERMS_CACHE[path] = (mtime, terms)  # one entry per file; an edit replaces it
+        return terms
+
 
+_TERMS_CACHE: dict[str, tuple[int, Terms]] = {}
 
+
+_RE_NONALNUM = re.compile(r"[^a-z0-9\s_\-]+")
+_RE_WS = re.compile(r"\s+")
+
+
+# bounded: match then auto-assign over the same workbook renormalize the same rows
+@lru_cache(maxsize=8192)
 def normalize_text(*parts: str | None) -> str:
-    text = " ".join([p or "" for p in parts])
+    text = " ".join(p or "" for p in parts)
     text = text.lower()
-    text = re.sub(r"[^a-z0-9\s_\-]+", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _RE_NONALNUM.sub(" ", text)
+    text = _RE_WS.sub(" ", text).strip()
     return text
 
 
@@ -51,38 +170,105 @@ def collect_signals(model_name: str, description: str | None, tags: list[str], t
     rule_hits: set[str] = set()
     fuzzy_hits: dict[str, int] = {}
 
-    for coll_name, cfg in terms.collections.items():
-        include_terms = set([s.lower() for s in (cfg.get("include_terms") or [])])
-        tag_terms = set([s.lower() for s in (cfg.get("tag_terms") or [])])
-        exclude_terms = set([s.lower() for s in (cfg.get("exclude_terms") or [])])
-        threshold = int(cfg.get("fuzzy_threshold", 88))
+    # Negative guards (same for every collection)
+    if terms.is_negative(name_desc):
+        return MatchSignals(tag_hits=tag_hits, rule_hits=rule_hits, fuzzy_hits=fuzzy_hits)
 
-        # Negative guards
-        if any(nt in name_desc for nt in terms.negative):
-            continue
-        if any(et in name_desc for et in exclude_terms):
+    excluded = terms.excluded_bits(name_desc)
+    for i, rule in enumerate(terms.rules):
+        coll_name = rule.name
+        if excluded >> i & 1:
             continue
 
         # Tag hits (exact tag terms)
-        if tag_terms & tagset:
+        if rule.tag_terms & tagset:
             tag_hits.add(coll_name)
 
         # Rule hits (token presence)
-        if include_terms & tokens:
+        if rule.include_terms & tokens:
             rule_hits.add(coll_name)
 
         # Fuzzy matches across include terms (try to catch near matches in text)
+        # cutoff = best so far (at least the threshold): rapidfuzz bails on hopeless alignments
         best_score = 0
-        for it in include_terms:
-            score = fuzz.partial_ratio(it, name_desc)
+        for it in rule.include_list:
+            score = fuzz.partial_ratio(it, name_desc, score_cutoff=max(rule.fuzzy_threshold, best_score))
             if score > best_score:
                 best_score = score
-        if best_score >= threshold:
+                if best_score >= 100:
+                    break
+        if best_score >= rule.fuzzy_threshold:
             fuzzy_hits[coll_name] = best_score
 
     return MatchSignals(tag_hits=tag_hits, rule_hits=rule_hits, fuzzy_hits=fuzzy_hits)
 
 
+def _rule_bits(words: t.Iterable[t.Iterable[str]], term_ids: dict[str, int], bits: np.ndarray) -> np.ndarray:
+    # OR each row's per-term rule masks (rows x mask words); every row starts with the pad id
+    # so no slice is empty
+    ids: list[int] = []
+    offsets: list[int] = []
+    for row in words:
+        offsets.append(len(ids))
+        ids.append(0)
+        ids.extend(term_ids[w] for w in row if w in term_ids)
+    return np.bitwise_or.reduceat(bits[np.asarray(ids, dtype=np.intp)], np.asarray(offsets, dtype=np.intp))
+
+
+def collect_signals_batch(model_names: t.Sequence[str], descriptions: t.Sequence[str | None],
+                          tags: t.Sequence[list[str]], terms: Terms) -> list[MatchSignals]:
+    """collect_signals over parallel column arrays; one MatchSignals per row.
+
+    Tag/rule hits come from per-row collection bitmasks, one uint64 word per 64 collections.
+    Fuzzy scores come from one
+    multi-threaded rapidfuzz cdist of the rows against every include term, reduced to each
+    collection's best term, instead of a partial_ratio call per term and row.
+    """
+    n = len(model_names)
+    if n == 0:
+        return []
+    texts = [normalize_text(nm, d, ",".join(tg)) for nm, d, tg in zip(model_names, descriptions, tags)]
+    inc = _rule_bits((set(s.split()) for s in texts), terms.term_ids, terms.include_bits)
+    tag = _rule_bits(({x.lower() for x in tg} for tg in tags), terms.term_ids, terms.tag_bits)
+
+    live = np.fromiter((not terms.is_negative(s) for s in texts), dtype=bool, count=n)
+    # exclude hits come back as one int per row; split the (rare) non-zero ones into mask words
+    excluded = np.zeros((n, terms.mask_words), dtype=np.uint64)
+    for j, s in enumerate(texts):
+        if live[j] and (b := terms.excluded_bits(s)):
+            excluded[j] = [b >> (_WORD_BITS * w) & _WORD_ALL for w in range(terms.mask_words)]
+
+    # best[j, k]: row j's top partial_ratio over fuzzy_rules[k]'s terms (0 below every threshold)
+    best = np.zeros((n, len(terms.fuzzy_rules)))
+    live_rows = np.flatnonzero(live)
+    if terms.terms_flat:
+        for start in range(0, len(live_rows), _FUZZY_BLOCK_ROWS):
+            block = live_rows[start:start + _FUZZY_BLOCK_ROWS]
+            m = process.cdist([texts[j] for j in block], terms.terms_flat, scorer=fuzz.partial_ratio,
+                              score_cutoff=terms.min_fuzzy_threshold, dtype=np.float64, workers=-1)
+            best[block] = np.maximum.reduceat(m, terms.term_offsets, axis=1)
+    fuzzy_col = {i: k for k, i in enumerate(terms.fuzzy_rules)}
+
+    signals = [MatchSignals(tag_hits=set(), rule_hits=set(), fuzzy_hits={}) for _ in range(n)]
+    # Rule-major so fuzzy_hits keeps collect_signals' insertion order
+    for i, rule in enumerate(terms.rules):
+        word, bit = divmod(i, _WORD_BITS)
+        bit = np.uint64(1 << bit)
+        allowed = live & ((excluded[:, word] & bit) == 0)
+        for j in np.flatnonzero(allowed & ((tag[:, word] & bit) != 0)):
+            signals[j].tag_hits.add(rule.name)
+        for j in np.flatnonzero(allowed & ((inc[:, word] & bit) != 0)):
+            signals[j].rule_hits.add(rule.name)
+
+        k = fuzzy_col.get(i)
+        if k is None:
+            continue
+        scores = best[:, k]
+        for j in np.flatnonzero(allowed & (scores >= rule.fuzzy_threshold)):
+            signals[j].fuzzy_hits[rule.name] = float(scores[j])
+    return signals
+
+
 def policy_assign(signals: MatchSignals, terms: Terms) -> PolicyResult:
     # Consensus-based policy
     votes: dict[str, int] = {}
@@ -2,8 +2,9 @@ from __future__ import annotations
 import logging
 from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 try:
     from .sketchfab_client import SketchfabClient
@@ -15,14 +16,17 @@ logger = logging.getLogger(__name__)
 
 
 def find_similar_collections(cols: pd.DataFrame, threshold: int = 90) -> List[Tuple[int, int, int]]:
-    pairs = []
-    names = cols["Collection Name"].tolist()
-    for i in range(len(names)):
-        for j in range(i + 1, len(names)):
-            s = fuzz.ratio(names[i].lower(), names[j].lower())
-            if s >= threshold:
-                pairs.append((i, j, s))
-    return sorted(pairs, key=lambda x: -x[2])
+    names = [n.lower() for n in cols["Collection Name"].astype(str).tolist()]
+    if len(names) < 2:
+        return []
+    # All pairs in one multi-threaded call; scores under the cutoff come back as 0.
+    # float64 keeps fuzz.ratio's fractional scores, so the cutoff is applied to the true value
+    m = process.cdist(names, names, scorer=fuzz.ratio, score_cutoff=threshold, dtype=np.float64, workers=-1)
+    iu, ju = np.triu_indices(len(names), k=1)
+    scores = m[iu, ju]
+    keep = np.flatnonzero(scores >= threshold)
+    keep = keep[np.argsort(-scores[keep], kind="stable")]
+    return list(zip(iu[keep].tolist(), ju[keep].tolist(), scores[keep].tolist()))
 
 
 def interactive_merge(cols_df: pd.DataFrame, client: SketchfabClient) -> None:
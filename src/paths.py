@@ -0,0 +1,4 @@
+# paths.py -- where the app keeps its files; stdlib only, so any module can import it cheaply
+import os
+
+DATA_DIR = os.environ.get("DATA_DIR", "data")
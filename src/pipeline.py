@@ -3,6 +3,7 @@ import argparse
 import logging
 import os
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -10,7 +11,7 @@ try:
     from .sketchfab_client import SketchfabClient
     from .data_io import write_workbook, read_workbook, XL_PATH
     from .matching import Terms
-    from .auto_assign import run_auto_assign
+    from .auto_assign import run_auto_assign, SUG_COL, FUZZY_COL
     from .push_assignments import push
     from .merge_collections import interactive_merge
 except ImportError:
@@ -18,10 +19,16 @@ except ImportError:
     from sketchfab_client import SketchfabClient
     from data_io import write_workbook, read_workbook, XL_PATH
     from matching import Terms
-    from auto_assign import run_auto_assign
+    from auto_assign import run_auto_assign, SUG_COL, FUZZY_COL
     from push_assignments import push
     from merge_collections import interactive_merge
 
+# Optional JIT for splitting the report's tag column on large workbooks
+try:
+    from numba import njit
+except ImportError:  # plain pandas path only
+    njit = None
+
 
 LOG_DIR = os.environ.get("LOG_DIR", "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -37,6 +44,46 @@ logger = logging.getLogger("pipeline")
 
 TERMS_PATH = os.environ.get("TERMS_PATH", os.path.join("terms", "collections_terms.yaml"))
 
+JIT_MIN_ROWS = 20000  # below this the pandas split/explode wins over JIT dispatch
+
+if njit is not None:
+    @njit(cache=True)  # cache=True keeps the compile off later runs
+    def _tag_spans_kernel(buf, min_len):
+        # (start, end) of every comma-separated, whitespace-stripped piece of at least min_len bytes
+        n = buf.shape[0]
+        out = np.empty((n // (min_len + 1) + 1, 2), dtype=np.int64)
+        k = 0
+        i = 0
+        while i <= n:
+            j = i
+            while j < n and buf[j] != 44:  # ","
+                j += 1
+            st, end = i, j
+            while st < end and (buf[st] == 32 or 9 <= buf[st] <= 13):
+                st += 1
+            while end > st and (buf[end - 1] == 32 or 9 <= buf[end - 1] <= 13):
+                end -= 1
+            if end - st >= min_len:
+                out[k, 0] = st
+                out[k, 1] = end
+                k += 1
+            i = j + 1
+        return out[:k]
+
+
+def _tag_tokens(tags: pd.Series, min_len: int) -> pd.Series:
+    """Lowercased, stripped comma-separated tags of at least min_len chars, one per entry."""
+    tags = tags.str.lower()
+    if njit is not None and len(tags) >= JIT_MIN_ROWS:
+        # rows joined by the separator itself, so pieces never span rows
+        raw = ",".join(tags.tolist())
+        if raw.isascii():  # byte offsets == char offsets
+            raw = raw.encode("ascii")
+            spans = _tag_spans_kernel(np.frombuffer(raw, dtype=np.uint8), min_len)
+            return pd.Series([raw[st:end].decode("ascii") for st, end in spans.tolist()], dtype="object")
+    toks = tags.str.split(",").explode().str.strip()
+    return toks[toks.str.len() >= min_len]
+
 def cmd_collect(args):
     from .collector import build_workbook
     path = build_workbook()
@@ -73,17 +120,22 @@ def cmd_match(args):
     terms = Terms.from_yaml(TERMS_PATH)
     liked_df, cols_df = read_workbook()
 
-    from .auto_assign import SUG_COL, FUZZY_COL
-    # Only recompute suggestions; don't touch Assigned here
-    updated = run_auto_assign(liked_df, terms, overwrite=False)
-    # Preserve the user's existing Assigned/Notes by copying back from liked_df where present
-    for col in ["Assigned Collection(s)", "Assignment Notes"]:
-        if col in liked_df.columns:
-            updated[col] = liked_df[col]
+    # Only recompute suggestions; the user's Assigned/Notes are left as they are
+    updated = run_auto_assign(liked_df, terms, suggest_only=True)
 
-    from .data_io import write_workbook
+    # Those are the only columns that can change; skip the rewrite when they read back the same
+    def as_text(df: pd.DataFrame, col: str) -> pd.Series | None:
+        return df[col].fillna("").astype(str) if col in df.columns else None
+
+    changed = [
+        col for col in (SUG_COL, FUZZY_COL)
+        if (old := as_text(liked_df, col)) is None or not old.equals(as_text(updated, col))
+    ]
+    if not changed:
+        logger.info("Suggestions/fuzzy unchanged; workbook left as is.")
+        return
     write_workbook(updated, cols_df)
-    logger.info("Updated suggestions/fuzzy in workbook.")
+    logger.info("Updated %s in workbook.", " and ".join(changed))
 
 
 def cmd_auto_assign(args):
@@ -102,25 +154,22 @@ def cmd_push(args):
 
 
 def cmd_report(args):
-    import collections
     liked_df, _ = read_workbook()
     pending = liked_df[(liked_df["Assigned Collection(s)"].isna()) | (liked_df["Assigned Collection(s)"] == "")]
     print(f"Unassigned models: {len(pending)}")
 
-    # Top tokens in names/descriptions to consider adding to terms
-    def toks(s: str) -> list[str]:
-        import re
-        s = (s or "").lower()
-        s = re.sub(r"[^a-z0-9\s]+", " ", s)
-        return [t for t in s.split() if len(t) >= 4]
+    def text(col: str) -> pd.Series:
+        if col not in pending.columns:
+            return pd.Series("", index=pending.index, dtype="object")
+        return pending[col].fillna("").astype(str)
 
-    counter = collections.Counter()
-    for _, r in pending.iterrows():
-        counter.update(toks((r.get("Model Name") or "") + " " + (r.get("Description") or "")))
-        counter.update([t.strip().lower() for t in str(r.get("Tags") or "").split(",") if t and len(t.strip()) >= 3])
+    # Top tokens in names/descriptions (4+ chars) and tags (3+ chars) to consider adding to terms
+    words = ((text("Model Name") + " " + text("Description")).str.lower()
+             .str.replace(r"[^a-z0-9\s]+", " ", regex=True).str.split().explode())
+    counts = pd.concat([words[words.str.len() >= 4], _tag_tokens(text("Tags"), 3)]).value_counts()
 
     print("\nCandidate new terms (top 50):")
-    for term, cnt in counter.most_common(50):
+    for term, cnt in counts.head(50).items():
         print(f"  {term:20s}  {cnt}")
 
 
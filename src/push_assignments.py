@@ -1,55 +1,94 @@
 from __future__ import annotations
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict
 
 import pandas as pd
 from tqdm import tqdm
 
 try:
+    from .frames import collection_name_map
     from .sketchfab_client import SketchfabClient
 except ImportError:
+    from frames import collection_name_map
     from sketchfab_client import SketchfabClient
 
 
 logger = logging.getLogger(__name__)
 
 ASSIGNED_COL = "Assigned Collection(s)"
+MODEL_UID_COL = "Model UID"
+PRELOAD_WORKERS = 8  # concurrent collection listings
+POST_WORKERS = 4     # concurrent POSTs; the client's write limiter still caps their combined rate
 
 
-def push(liked_df: pd.DataFrame, collections_df: pd.DataFrame, client: SketchfabClient, dry_run: bool = False) -> None:
-    # Map collection name -> uid
-    name_to_uid: Dict[str, str] = {r["Collection Name"]: r["Collection UID"] for _, r in collections_df.iterrows()}
+def push(liked_df: pd.DataFrame, collections_df: pd.DataFrame, client: SketchfabClient, dry_run: bool = False,
+         name_to_uid: Dict[str, str] | None = None) -> None:
+    if liked_df.empty:
+        logger.info("No assignments to push.")
+        return
+    if MODEL_UID_COL not in liked_df.columns:
+        raise ValueError(f"Liked sheet has no '{MODEL_UID_COL}' column; nothing to push.")
+
+    # Map collection name -> uid (callers holding one already, like the GUI state, pass it in)
+    if name_to_uid is None:
+        name_to_uid = collection_name_map(collections_df)
 
     # Preload models already in collections (to avoid duplicate POSTs)
     existing: Dict[str, set[str]] = {name: set() for name in name_to_uid}
-    for name, uid in name_to_uid.items():
-        try:
-            uids = client.list_models_in_collection(uid)
-            existing[name] = set(uids)
-        except Exception as e:
-            logger.warning("Could not list models for collection %s: %s", name, e)
-
-    ops = []
-    for _, row in liked_df.iterrows():
-        model_uid = row.get("Model UID")
-        want = [s.strip() for s in str(row.get(ASSIGNED_COL) or "").split(",") if s.strip()]
-        for coll_name in want:
-            if coll_name not in name_to_uid:
-                logger.warning("Assigned collection '%s' not found in current collections; skipping model %s", coll_name, model_uid)
-                continue
-            if model_uid in existing.get(coll_name, set()):
-                continue
-            ops.append((name_to_uid[coll_name], model_uid, coll_name))
+    with ThreadPoolExecutor(max_workers=PRELOAD_WORKERS) as pool:
+        futures = {pool.submit(client.list_models_in_collection, uid): name for name, uid in name_to_uid.items()}
+        for fut in as_completed(futures):
+            name = futures[fut]
+            try:
+                existing[name] = set(fut.result())
+            except Exception as e:
+                logger.warning("Could not list models for collection %s: %s", name, e)
+
+    # Plan: one (collection, model) row per assigned name, in sheet order, minus pairs already present
+    if ASSIGNED_COL in liked_df.columns:
+        assigned = pd.Series(liked_df[ASSIGNED_COL].fillna("").astype(str).to_numpy(), dtype="object")
+    else:
+        assigned = pd.Series([""] * len(liked_df), dtype="object")
+    want = assigned.str.split(",").explode().str.strip()
+    want = want[want.notna() & want.ne("")]
+    plan = pd.DataFrame({
+        "coll_name": want.to_numpy(),
+        "model_uid": liked_df[MODEL_UID_COL].to_numpy()[want.index.to_numpy(dtype=int)],
+    })
+    blank = plan["model_uid"].fillna("").astype(str).str.strip().eq("")
+    if blank.any():
+        logger.warning("Skipping %d assignment(s) on rows without a %s", int(blank.sum()), MODEL_UID_COL)
+        plan = plan[~blank]
+    plan["coll_uid"] = plan["coll_name"].map(name_to_uid)
+
+    missing = plan["coll_uid"].isna()
+    for coll_name, model_uid in zip(plan.loc[missing, "coll_name"], plan.loc[missing, "model_uid"]):
+        logger.warning("Assigned collection '%s' not found in current collections; skipping model %s", coll_name, model_uid)
+    plan = plan[~missing].drop_duplicates(["coll_name", "model_uid"])
+
+    present = pd.DataFrame(
+        [(name, uid) for name, uids in existing.items() for uid in uids],
+        columns=["coll_name", "model_uid"], dtype="object",
+    )
+    plan = plan.merge(present, on=["coll_name", "model_uid"], how="left", indicator=True)
+    plan = plan[plan["_merge"] == "left_only"]
+    ops = list(zip(plan["coll_uid"], plan["model_uid"], plan["coll_name"]))
 
     if not ops:
         logger.info("No assignments to push.")
         return
 
     logger.info("Pushing %d assignments (dry_run=%s)", len(ops), dry_run)
-    for coll_uid, model_uid, coll_name in tqdm(ops, desc="Posting"):
-        if dry_run:
-            continue
-        try:
-            client.add_model_to_collection(coll_uid, model_uid)
-        except Exception as e:
-            logger.error("Failed to add model %s to %s: %s", model_uid, coll_name, e)
\ No newline at end of file
+    if dry_run:
+        return
+    # Workers overlap request latency; spacing between POSTs is enforced inside the client
+    with ThreadPoolExecutor(max_workers=POST_WORKERS) as pool:
+        futures = {pool.submit(client.add_model_to_collection, coll_uid, model_uid): (model_uid, coll_name)
+                   for coll_uid, model_uid, coll_name in ops}
+        for fut in tqdm(as_completed(futures), total=len(futures), desc="Posting"):
+            try:
+                fut.result()
+            except Exception as e:
+                model_uid, coll_name = futures[fut]
+                logger.error("Failed to add model %s to %s: %s", model_uid, coll_name, e)
\ No newline at end of file
@@ -1,6 +1,13 @@
 from __future__ import annotations
 import os
+import json
+import tempfile
+import contextlib
 import time
+import atexit
+import random
+import hashlib
+import threading
 import typing as t
 import logging
 from dataclasses import dataclass
@@ -8,6 +15,16 @@ from dataclasses import dataclass
 import requests
 from dotenv import load_dotenv
 
+try:  # optional: C JSON decoder for the paginated listings
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from .paths import DATA_DIR
+except ImportError:
+    from paths import DATA_DIR
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -17,15 +34,64 @@ TOKEN = os.environ.get("SKETCHFAB_TOKEN")
 
 MIN_POST_INTERVAL_SEC = float(os.environ.get("MIN_POST_INTERVAL_SEC", "1.0"))
 
-@dataclass
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+MAX_ATTEMPTS = 7
+BACKOFF_BASE_SEC = 0.5
+BACKOFF_CAP_SEC = 60.0
+
+
+# Collection items from earlier runs: {collection uid: {"etag" + "pages" | "checksum": ..., "uids": [...]}}
+ITEMS_CACHE_PATH = os.environ.get("ITEMS_CACHE_PATH", os.path.join(DATA_DIR, "_cache", "collections.json"))
+
+# One items cache per process, shared by every client: loaded on first use, saved once at exit
+_items_cache: dict[str, dict] | None = None
+_items_cache_lock = threading.Lock()
+
+
+def _load_items_cache() -> dict[str, dict]:
+    try:
+        with open(ITEMS_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_items_cache() -> None:
+    try:
+        cache_dir = os.path.dirname(ITEMS_CACHE_PATH) or "."
+        os.makedirs(cache_dir, exist_ok=True)
+        # own temp file per writer: the GUI and a CLI push may flush at the same time
+        fd, tmp = tempfile.mkstemp(prefix="collections.", suffix=".tmp.json", dir=cache_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(_items_cache, f)
+            os.replace(tmp, ITEMS_CACHE_PATH)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp)
+    except OSError as e:
+        logger.warning("Could not save collection items cache: %s", e)
+
+
+def _shared_items_cache() -> dict[str, dict]:
+    global _items_cache
+    with _items_cache_lock:
+        if _items_cache is None:
+            _items_cache = _load_items_cache()
+            atexit.register(_save_items_cache)
+        return _items_cache
+
+
+# slots: no per-instance __dict__ across a user's whole likes list
+@dataclass(slots=True, frozen=True)
 class Model:
     uid: str
     name: str
-    tags: list[str]
+    tags: tuple[str, ...]
     author: str | None
     is_downloadable: bool | None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Collection:
     uid: str
     name: str
@@ -37,7 +103,9 @@ class SketchfabClient:
         self.token = token or TOKEN
         if not self.token:
             raise RuntimeError("SKETCHFAB_TOKEN not set (env or .env).")
-        self._last_post_at = 0.0
+        # Next moment a write may start; shared by every thread using this client
+        self._next_write_at = 0.0
+        self._write_lock = threading.Lock()
         self.sess = requests.Session()
         self.sess.headers.update({
             "Authorization": f"Token {self.token}",
@@ -45,25 +113,63 @@ class SketchfabClient:
             "Content-Type": "application/json",
             "User-Agent": "Sketchfab-Collections-Pipeline/5.0"
         })
+        self._items_cache = _shared_items_cache()
+
+    # --- collection items cache ---
+    def _collection_checksum(self, collection_uid: str) -> str | None:
+        # Fallback when /items sends no ETag: one small GET instead of walking every page
+        try:
+            data = self._json(self._request("GET", f"/collections/{collection_uid}"))
+        except (requests.RequestException, ValueError) as e:
+            logger.debug("Checksum probe for collection %s failed: %s", collection_uid, e)
+            return None
+        stamp = (data.get("updatedAt"), data.get("modelCount"))
+        if stamp == (None, None):
+            return None
+        return hashlib.sha1(repr(stamp).encode("utf-8")).hexdigest()
 
     # --- HTTP ---
+    def _wait_write_slot(self) -> None:
+        # Reserve the next slot under the lock, sleep outside it: concurrent writers are
+        # spaced MIN_POST_INTERVAL_SEC apart start-to-start, whatever the thread count
+        with self._write_lock:
+            now = time.monotonic()
+            start = max(now, self._next_write_at)
+            self._next_write_at = start + MIN_POST_INTERVAL_SEC
+        if start > now:
+            time.sleep(start - now)
+
+    @staticmethod
+    def _retry_wait(resp: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a throttled/failed response."""
+        # A server-given time is a floor; a little jitter keeps concurrent callers apart
+        retry_after = resp.headers.get("Retry-After")
+        reset = resp.headers.get("X-RateLimit-Reset")
+        try:
+            if retry_after is not None:
+                return min(BACKOFF_CAP_SEC, float(retry_after)) + random.uniform(0, BACKOFF_BASE_SEC)
+            if reset is not None:
+                reset = float(reset)
+                if reset > 1e9:  # epoch seconds rather than a delta
+                    reset -= time.time()
+                return min(BACKOFF_CAP_SEC, max(0.0, reset)) + random.uniform(0, BACKOFF_BASE_SEC)
+        except ValueError:  # e.g. an HTTP-date Retry-After
+            pass
+        # Full jitter: uniform over the exponential window
+        return random.uniform(0, min(BACKOFF_CAP_SEC, BACKOFF_BASE_SEC * 2 ** attempt))
+
     def _request(self, method: str, path: str, **kwargs) -> requests.Response:
         url = path if path.startswith("http") else f"{self.api_base}{path}"
-        for attempt in range(5):
-            # Enforce min delay for POST-like methods
-            if method.upper() in {"POST", "PUT", "PATCH", "DELETE"}:
-                elapsed = time.time() - self._last_post_at
-                if elapsed < MIN_POST_INTERVAL_SEC:
-                    time.sleep(MIN_POST_INTERVAL_SEC - elapsed)
+        is_write = method.upper() in _WRITE_METHODS
+        for attempt in range(MAX_ATTEMPTS):
+            # Enforce the global write rate for POST-like methods
+            if is_write:
+                self._wait_write_slot()
 
             resp = self.sess.request(method, url, timeout=30, **kwargs)
 
-            # Record POST time after request completes (regardless of status)
-            if method.upper() in {"POST", "PUT", "PATCH", "DELETE"}:
-                self._last_post_at = time.time()
-
             if resp.status_code in (429, 502, 503, 504):
-                wait = float(resp.headers.get("Retry-After", 1 + attempt))
+                wait = self._retry_wait(resp, attempt)
                 logger.warning("HTTP %s to %s throttled (%s). Sleeping %.2fs", method, url, resp.status_code, wait)
                 time.sleep(wait)
                 continue
@@ -75,6 +181,10 @@ class SketchfabClient:
         # If loop exits without return, raise last
         resp.raise_for_status()
 
+    @staticmethod
+    def _json(resp: requests.Response) -> dict:
+        return orjson.loads(resp.content) if orjson is not None else resp.json()
+
     def get_liked_models(self, progress: bool = False) -> list[Model]:
         models: list[Model] = []
         url = f"{self.api_base}/me/likes"
@@ -82,16 +192,18 @@ class SketchfabClient:
         total = 0
         while url:
             resp = self._request("GET", url)
-            data = resp.json()
+            data = self._json(resp)
             results = data.get("results", [])
             for m in results:
-                uid = m.get("uid") or m.get("model", {}).get("uid") or m.get("uid")
-                name = m.get("name") or m.get("model", {}).get("name") or ""
-                tags = [t["name"] if isinstance(t, dict) else str(t) for t in (m.get("tags") or m.get("model", {}).get("tags") or [])]
-                author = (m.get("user") or m.get("model", {}).get("user") or {}).get("displayName")
-                downloadable = (m.get("isDownloadable") if "isDownloadable" in m else (m.get("model", {}).get("isDownloadable")))
+                # a like is either the model itself or a wrapper around it; fall back field by field
+                get, inner = m.get, (m.get("model") or {}).get
+                uid = get("uid") or inner("uid")
                 if not uid:
                     continue
+                name = get("name") or inner("name") or ""
+                tags = tuple(t["name"] if isinstance(t, dict) else str(t) for t in (get("tags") or inner("tags") or ()))
+                author = (get("user") or inner("user") or {}).get("displayName")
+                downloadable = get("isDownloadable") if "isDownloadable" in m else inner("isDownloadable")
                 models.append(Model(uid=uid, name=name, tags=tags, author=author, is_downloadable=downloadable))
             total += len(results)
             if progress:
@@ -107,7 +219,7 @@ class SketchfabClient:
         total = 0
         while url:
             resp = self._request("GET", url)
-            data = resp.json()
+            data = self._json(resp)
             results = data.get("results", [])
             for c in results:
                 cols.append(Collection(uid=c.get("uid"), name=c.get("name"), slug=c.get("slug")))
@@ -119,20 +231,48 @@ class SketchfabClient:
         return cols
 
     def list_models_in_collection(self, collection_uid: str) -> list[str]:
+        """Model uids in a collection; unchanged collections are answered from the items cache."""
+        cached = self._items_cache.get(collection_uid) or {}
+        checksum = None
+        if "checksum" in cached:
+            checksum = self._collection_checksum(collection_uid)
+            if checksum is not None and checksum == cached["checksum"]:
+                return list(cached["uids"])
+
         uids: list[str] = []
         url = f"{self.api_base}/collections/{collection_uid}/items"
-        while url:
-            resp = self._request("GET", url)
-            data = resp.json()
+        # entries written before "pages" was recorded may hold a first-page-only ETag: not trusted
+        headers = {"If-None-Match": cached["etag"]} if "etag" in cached and cached.get("pages") == 1 else {}
+        resp = self._request("GET", url, headers=headers)
+        if resp.status_code == 304:
+            return list(cached["uids"])
+        etag = resp.headers.get("ETag")
+        pages = 0
+        while True:
+            pages += 1
+            data = self._json(resp)
             for item in data.get("results", []):
                 uid = (item.get("model") or {}).get("uid")
                 if uid:
                     uids.append(uid)
             url = data.get("next")
+            if not url:
+                break
+            resp = self._request("GET", url)
+
+        if etag and pages == 1:
+            # the ETag only covers the first page; longer listings are validated by checksum
+            self._items_cache[collection_uid] = {"etag": etag, "pages": 1, "uids": uids}
+        else:
+            checksum = checksum or self._collection_checksum(collection_uid)
+            if checksum is not None:
+                self._items_cache[collection_uid] = {"checksum": checksum, "uids": uids}
         return uids
 
     def add_model_to_collection(self, collection_uid: str, model_uid: str) -> None:
         self._request("POST", f"/collections/{collection_uid}/items", json={"model": model_uid})
+        self._items_cache.pop(collection_uid, None)
 
     def remove_model_from_collection(self, collection_uid: str, model_uid: str) -> None:
-        self._request("DELETE", f"/collections/{collection_uid}/items/{model_uid}")
\ No newline at end of file
+        self._request("DELETE", f"/collections/{collection_uid}/items/{model_uid}")
+        self._items_cache.pop(collection_uid, None)
\ No newline at end of file
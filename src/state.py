@@ -3,6 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import pandas as pd
 
+try:
+    from .frames import collection_name_map
+except ImportError:
+    from frames import collection_name_map
+
 @dataclass
 class AppState:
     liked_df: pd.DataFrame = field(default_factory=lambda: pd.DataFrame())
@@ -14,4 +19,16 @@ class AppState:
     # paging
     liked_page: int = 0
     colls_page: int = 0
-    page_size: int = 50
\ No newline at end of file
+    page_size: int = 50
+    # frame the map was built from; the frame itself, not id(), so a recycled id can't match.
+    # colls_df is only ever replaced, never edited in place, so identity is enough
+    _name_map_src: pd.DataFrame | None = field(default=None, init=False, repr=False, compare=False)
+    _name_map: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def name_to_uid(self) -> dict[str, str]:
+        """Collection name -> uid for colls_df, rebuilt only when colls_df is replaced."""
+        if self._name_map_src is not self.colls_df:
+            self._name_map = collection_name_map(self.colls_df)
+            self._name_map_src = self.colls_df
+        return self._name_map
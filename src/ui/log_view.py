@@ -1,17 +1,37 @@
 # ui/log_view.py
+import threading
+from collections import deque
+
 import flet as ft
 
+MAX_LINES = 2000      # older lines scroll out of the view
+FLUSH_DELAY_S = 0.05  # bursts of appends share one update (<= 20 Hz)
+
 class LogView(ft.Container):
     def __init__(self):
         super().__init__(expand=True, content=ft.Text("", selectable=True))
+        self._buf = deque(maxlen=MAX_LINES)
+        self._flush_timer = None
+        self._lock = threading.Lock()
 
     def append(self, line: str):
-        t = self.content
-        t.value = (t.value + ("\n" if t.value else "") + line)
-        if self.page:           # only update when mounted
+        # only buffer here; the text is joined once per flush, however many lines arrived
+        with self._lock:
+            self._buf.extend(str(line).splitlines() or [""])
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(FLUSH_DELAY_S, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush(self):
+        with self._lock:   # one join per flush; under the lock so an older text can't land last
+            self._flush_timer = None
+            self.content.value = "\n".join(self._buf)
+        if self.page:   # only update when mounted
             self.update()
 
     def set(self, text: str):
-        self.content.value = text or ""
-        if self.page:
-            self.update()
+        with self._lock:
+            self._buf.clear()
+            self._buf.extend((text or "").splitlines())
+        self._flush()
@@ -1,8 +1,13 @@
 import flet as ft
 
+try:
+    from .paging import page_bounds, clamp_page
+except ImportError:
+    from paging import page_bounds, clamp_page
+
 def build_pager(total_rows: int, page: int, page_size: int, on_change_page, on_change_size):
-    pages = max(1, (total_rows + page_size - 1) // page_size)
-    page = max(0, min(page, pages - 1))
+    pages, _ = page_bounds(total_rows, page_size)
+    page = clamp_page(page, pages)
     return ft.Row(
         [
             ft.Text(f"{total_rows} rows  |  page {page+1}/{pages}"),
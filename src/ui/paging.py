@@ -0,0 +1,47 @@
+# ui/paging.py
+from functools import lru_cache
+
+import flet as ft
+
+@lru_cache(maxsize=64)
+def page_bounds(total: int, page_size: int) -> tuple[int, int]:
+    # (page count, last page index); an empty table still shows one page
+    pages = max(1, -(-total // page_size))
+    return pages, pages - 1
+
+def clamp_page(page: int, pages: int) -> int:
+    return 0 if page < 0 else pages - 1 if page >= pages else page
+
+def cell_strings(dfp):
+    # whole page stringified at once (missing -> "None") as nested lists; one object copy of the page
+    arr = dfp.to_numpy(dtype=object, copy=True)  # never a view of df
+    arr[dfp.isna().to_numpy()] = "None"
+    return [list(map(str, row)) for row in arr.tolist()]
+
+class TableRows:
+    """Header and row widgets of one DataTable, reused across page flips while the columns stay the same."""
+
+    def __init__(self, table: ft.DataTable):
+        self.table = table
+        self._cols_sig = None   # columns the header row was built for
+        self._cells = []        # per shown row, its ft.Text widgets
+
+    def clear(self, placeholder: ft.DataColumn):
+        self.table.columns, self.table.rows = [placeholder], []
+        self._cols_sig, self._cells = None, []
+
+    def show(self, columns, dfp):
+        sig = tuple(columns)
+        if sig != self._cols_sig:
+            self.table.columns = [ft.DataColumn(ft.Text(c)) for c in sig]
+            self.table.rows, self._cols_sig, self._cells = [], sig, []
+        # same columns: rewrite the existing Text values, only adding/dropping rows for a size change
+        strings = cell_strings(dfp)
+        for texts, row in zip(self._cells, strings):
+            for t, v in zip(texts, row):
+                t.value = v
+        for row in strings[len(self._cells):]:
+            texts = [ft.Text(v) for v in row]
+            self._cells.append(texts)
+            self.table.rows.append(ft.DataRow(cells=[ft.DataCell(t) for t in texts]))
+        del self._cells[len(strings):], self.table.rows[len(strings):]